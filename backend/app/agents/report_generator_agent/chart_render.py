@@ -0,0 +1,231 @@
+"""
+SVG chart rendering for pharmaceutical intelligence reports.
+
+Self-contained and fully annotated so it can be compiled with mypyc
+(`mypyc chart_render.py`) for the report hot path; when no compiled build
+is present the same module runs as plain Python.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+from itertools import cycle, islice
+from html import escape
+from string import Template
+import functools
+import math
+
+
+# Bar chart canvas. The frame (viewBox and axes) only depends on these, so it
+# is built once; per render only the title and the data children are written.
+_BAR_CHART_WIDTH = 600
+_BAR_CHART_HEIGHT = 300
+_BAR_CHART_MARGIN: Mapping[str, int] = MappingProxyType({"top": 20, "right": 30, "bottom": 60, "left": 60})
+_BAR_CHART_PLOT_BOTTOM = _BAR_CHART_HEIGHT - _BAR_CHART_MARGIN["bottom"]
+
+_BAR_CHART_HEAD = Template(f"""
+        <div class="chart-container">
+            <p class="chart-title">$title</p>
+            <svg class="chart-svg" viewBox="0 0 {_BAR_CHART_WIDTH} {_BAR_CHART_HEIGHT}">
+                <!-- Grid lines -->
+                <line x1="{_BAR_CHART_MARGIN["left"]}" y1="{_BAR_CHART_MARGIN["top"]}" 
+                      x2="{_BAR_CHART_MARGIN["left"]}" y2="{_BAR_CHART_PLOT_BOTTOM}" 
+                      class="axis-line"/>
+                <line x1="{_BAR_CHART_MARGIN["left"]}" y1="{_BAR_CHART_PLOT_BOTTOM}" 
+                      x2="{_BAR_CHART_WIDTH - _BAR_CHART_MARGIN["right"]}" y2="{_BAR_CHART_PLOT_BOTTOM}" 
+                      class="axis-line"/>
+                
+                """)
+_BAR_CHART_SEP = "\n                "
+_BAR_CHART_TAIL = """
+            </svg>
+        </div>
+        """
+
+# Bar chart SVG fragments: bar, x-axis label, value label (positional fields)
+_BAR_RECT_SVG = """
+            <rect x="{}" y="{}" width="{}" height="{}" 
+                  fill="{}" rx="4" opacity="0.9"/>
+            """
+_BAR_LABEL_SVG = """
+            <text x="{}" y="{}" 
+                  class="label" text-anchor="middle">{}</text>
+            """
+_BAR_VALUE_SVG = """
+            <text x="{}" y="{}" 
+                  class="value-label" text-anchor="middle">${}B</text>
+            """
+
+# Donut chart canvas; slice paths bake in the two radii and take the
+# _donut_geometry() tuple plus a colour as positional fields
+_DONUT_CENTER = 120
+_DONUT_OUTER_R = 100
+_DONUT_INNER_R = 60
+
+_DONUT_CHART_HEAD = Template("""
+        <div class="chart-container">
+            <p class="chart-title">$title</p>
+            <div class="donut-chart-container">
+                <svg width="240" height="240" viewBox="0 0 240 240">
+                    """)
+_DONUT_SLICE_SVG = (
+    f'<path d="M {{1}} {{2}} A {_DONUT_OUTER_R} {_DONUT_OUTER_R} 0 {{0}} 1 {{3}} {{4}} '
+    f'L {{5}} {{6}} A {_DONUT_INNER_R} {_DONUT_INNER_R} 0 {{0}} 0 {{7}} {{8}} Z" '
+    'fill="{9}" stroke="var(--card)" stroke-width="2"/>'
+)
+_DONUT_LEGEND_ITEM_HTML = """
+            <div class="donut-legend-item">
+                <div class="donut-legend-color" style="background: {};"></div>
+                <span class="donut-legend-label">{}</span>
+                <span class="donut-legend-value">{:.0f}%</span>
+            </div>
+            """
+_DONUT_CHART_LEGEND_OPEN = """
+                </svg>
+                <div class="donut-legend">
+                    """
+_DONUT_CHART_TAIL = """
+                </div>
+            </div>
+        </div>
+        """
+
+
+class _HtmlBuffer:
+    """Append-only fragment buffer; one join at the end instead of nested joins and f-string copies."""
+    
+    __slots__ = ("parts",)
+    
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+    
+    def write(self, fragment: str) -> None:
+        self.parts.append(fragment)
+    
+    def extend(self, fragments: Iterable[str]) -> None:
+        self.parts.extend(fragments)
+    
+    def getvalue(self) -> str:
+        return "".join(self.parts)
+
+
+def _donut_geometry(
+    values: List[float], total: float, cx: float, cy: float, outer_r: float, inner_r: float
+) -> List[Tuple[float, ...]]:
+    """
+    Compute donut slice coordinates, starting at 12 o'clock and going clockwise.
+    
+    Returns one (large_arc, x1, y1, x2, y2, x3, y3, x4, y4) tuple per value:
+    outer arc start/end, then inner arc end/start. Each slice starts where the
+    previous one ended, so every boundary's cos/sin is computed only once.
+    """
+    cos, sin, radians = math.cos, math.sin, math.radians
+    start_angle = -90.0
+    start_rad = radians(start_angle)
+    start_cos, start_sin = cos(start_rad), sin(start_rad)
+    geometry: List[Tuple[float, ...]] = []
+    
+    for value in values:
+        angle = value / total * 360
+        end_angle = start_angle + angle
+        end_rad = radians(end_angle)
+        end_cos, end_sin = cos(end_rad), sin(end_rad)
+        geometry.append((
+            1 if angle > 180 else 0,
+            cx + outer_r * start_cos, cy + outer_r * start_sin,
+            cx + outer_r * end_cos, cy + outer_r * end_sin,
+            cx + inner_r * end_cos, cy + inner_r * end_sin,
+            cx + inner_r * start_cos, cy + inner_r * start_sin,
+        ))
+        start_angle, start_cos, start_sin = end_angle, end_cos, end_sin
+    
+    return geometry
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_share(share: str) -> float:
+    """Parse a market-share string such as "~35%" (few distinct values per report)."""
+    return float(share.replace("%", "").replace("~", "").strip() or 0)
+
+
+def render_bar_chart(title: str, data: List[Dict[str, Any]], x_field: str, y_field: str, color: str = "#3b82f6") -> str:
+    """Render a simple SVG bar chart"""
+    if not data:
+        return ""
+    
+    margin = _BAR_CHART_MARGIN
+    chart_width = _BAR_CHART_WIDTH - margin["left"] - margin["right"]
+    chart_height = _BAR_CHART_HEIGHT - margin["top"] - margin["bottom"]
+    
+    # Get max value
+    max_val = max(d.get(y_field, 0) for d in data)
+    if max_val == 0:
+        max_val = 1
+    
+    # Bar width
+    bar_width = chart_width / len(data) * 0.7
+    bar_gap = chart_width / len(data) * 0.15
+    
+    labels: List[str] = []
+    values: List[str] = []
+    label_y = _BAR_CHART_HEIGHT - 20
+    
+    rect_svg = _BAR_RECT_SVG.format
+    label_svg = _BAR_LABEL_SVG.format
+    value_svg = _BAR_VALUE_SVG.format
+    
+    buf = _HtmlBuffer()
+    buf.write(_BAR_CHART_HEAD.substitute(title=escape(str(title))))
+    
+    # Bars stream straight into the buffer; labels and values follow them
+    for i, d in enumerate(data):
+        x = margin["left"] + i * (chart_width / len(data)) + bar_gap
+        val = d.get(y_field, 0)
+        bar_height = (val / max_val) * chart_height
+        y = margin["top"] + chart_height - bar_height
+        
+        buf.write(rect_svg(x, y, bar_width, bar_height, color))
+        labels.append(label_svg(x + bar_width/2, label_y, escape(str(d.get(x_field, "")))))
+        values.append(value_svg(x + bar_width/2, y - 5, val))
+    
+    buf.write(_BAR_CHART_SEP)
+    buf.extend(labels)
+    buf.write(_BAR_CHART_SEP)
+    buf.extend(values)
+    buf.write(_BAR_CHART_TAIL)
+    return buf.getvalue()
+
+
+def _share_value(share: Any) -> float:
+    """Numeric share from a number or a string such as "~35%"."""
+    if isinstance(share, (int, float)):
+        return float(share)
+    return _parse_share(str(share))
+
+
+def render_pie_chart(
+    title: str, data: List[Dict[str, Any]], label_field: str, value_field: str, palette: Sequence[str]
+) -> str:
+    """Render a simple SVG donut chart, colouring slices by cycling over palette"""
+    if not data:
+        return ""
+    
+    # Parallel per-slice columns; the palette repeats every len(palette) slices
+    labels = [escape(str(d.get(label_field, ""))) for d in data]
+    values = [_share_value(d.get(value_field, 0)) for d in data]
+    colors = list(islice(cycle(palette), len(values)))
+    total = sum(values) or 1
+    
+    # Generate pie slices
+    geometry = _donut_geometry(values, total, _DONUT_CENTER, _DONUT_CENTER, _DONUT_OUTER_R, _DONUT_INNER_R)
+    slice_svg = _DONUT_SLICE_SVG.format
+    
+    buf = _HtmlBuffer()
+    buf.write(_DONUT_CHART_HEAD.substitute(title=escape(str(title))))
+    for slice_geometry, color in zip(geometry, colors):
+        buf.write(slice_svg(*slice_geometry, color))
+    legend_items = map(_DONUT_LEGEND_ITEM_HTML.format, colors, labels, values)
+    
+    buf.write(_DONUT_CHART_LEGEND_OPEN)
+    buf.extend(legend_items)
+    buf.write(_DONUT_CHART_TAIL)
+    return buf.getvalue()
@@ -13,6 +13,7 @@ Features:
 
 import os
 import json
+import re
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from dataclasses import asdict
@@ -40,6 +41,25 @@ from .report_schema import (
 )
 from .report_template import PharmReportTemplate
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Characters replaced with "_" when a drug name is used in a file name:
+# anything but letters, digits, space, "-" and "_"
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w -]")
+
+
+def _write_debug_json(path, payload: Any) -> None:
+    """Dump a debug payload as indented JSON; uses orjson when installed (agent data can be large)."""
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, default=str)
+
 
 # Initialize LLM (using Groq like other agents)
 def get_llm():
@@ -404,11 +424,10 @@ class ReportGeneratorAgent:
             debug_dir.mkdir(exist_ok=True)
             
             # Create safe filename
-            safe_drug = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in drug_name)
+            safe_drug = _UNSAFE_FILENAME_CHARS_RE.sub("_", drug_name)
             debug_file = debug_dir / f"report_data_{safe_drug}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             
-            with open(debug_file, 'w') as f:
-                json.dump(debug_data, f, indent=2, default=str)
+            _write_debug_json(debug_file, debug_data)
             
             print(f"🔍 DEBUG: Report data saved to {debug_file}")
             
@@ -445,13 +464,12 @@ class ReportGeneratorAgent:
             }
             
             template_debug_file = debug_dir / f"template_input_{safe_drug}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(template_debug_file, 'w') as f:
-                json.dump(template_debug_data, f, indent=2, default=str)
+            _write_debug_json(template_debug_file, template_debug_data)
             
             print(f"🔍 DEBUG: Template data saved to {template_debug_file}")
             
-            # Step 4: Generate HTML
-            html_content = self.template.generate(report_data)
+            # Step 4: Generate HTML (print-only stylesheet when it is headed for a PDF)
+            html_content = self.template.generate(report_data, for_pdf=output_format == "pdf")
             
             result = {
                 "status": "success",
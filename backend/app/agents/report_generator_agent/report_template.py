@@ -12,67 +12,755 @@ Features:
 - Print-optimized CSS
 """
 
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Iterable, Mapping, Optional, Callable, Iterator, TextIO
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-import json
+from html import escape
+from string import Formatter, Template
+import bisect
+import functools
+import hashlib
+import operator
+import os
+import re
+import threading
 
+from .chart_render import render_bar_chart, render_pie_chart
+from .report_schema import (
+    parse_agent_data_from_dict,
+    compute_opportunity_score,
+    generate_key_takeaways,
+    generate_recommendation
+)
 
-class PharmReportTemplate:
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import rcssmin
+    HAS_RCSSMIN = True
+except ImportError:
+    HAS_RCSSMIN = False
+
+
+# ============================================
+# REPORT FONTS
+# ============================================
+# Linked once from <head>; the stylesheet itself no longer @imports them.
+_FONTS_HTML = """<link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;500;600;700;800&family=DM+Sans:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">"""
+
+
+# ============================================
+# PRECOMPILED HTML SHELLS
+# ============================================
+# The render methods only bind the dynamic slots.
+
+# Accent per agent, set inline on section icons and summary banners:
+# gradient stops (--agent-from/--agent-to) and the glow colour (--agent-rgb)
+_AGENT_TONES = MappingProxyType({
+    "iqvia": ("var(--iqvia)", "#0891b2", "6, 182, 212"),
+    "clinical": ("var(--clinical)", "#10b981", "52, 211, 153"),
+    "patent": ("var(--patent)", "#f59e0b", "251, 191, 36"),
+    "exim": ("var(--exim)", "#14b8a6", "45, 212, 191"),
+    "internal": ("var(--internal)", "#ec4899", "244, 114, 182"),
+    "web": ("var(--web)", "#0ea5e9", "56, 189, 248"),
+})
+
+_AGENT_TONE_STYLE = MappingProxyType({
+    agent: f"--agent-from: {start}; --agent-to: {end}; --agent-rgb: {rgb};"
+    for agent, (start, end, rgb) in _AGENT_TONES.items()
+})
+
+_PAGE_BREAK_HTML = """
+        <div class="page-break"></div>
+        """
+
+# Whole-document skeleton. generate() fills it with a single format_map();
+# iter_html() walks the pre-parsed (literal, field) parts to stream it.
+_REPORT_SKELETON = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Pharmaceutical Intelligence Report — {title}</title>
+    {fonts}
+    {styles}
+</head>
+<body>
+    <div class="report-container">
+        {cover}{executive}{iqvia}{clinical}{page_break}{patent}{exim}{page_break}{internal}{web}{footer}
+    </div>
+</body>
+</html>
+        """
+
+_REPORT_SKELETON_PARTS = tuple(
+    (literal, field) for literal, field, _, _ in Formatter().parse(_REPORT_SKELETON)
+)
+
+# Same parts with the literal markup pre-encoded, for generate_bytes()
+_REPORT_SKELETON_BYTE_PARTS = tuple(
+    (literal.encode("utf-8"), field) for literal, field in _REPORT_SKELETON_PARTS
+)
+
+_COVER_TEMPLATE = Template("""
+        <div class="cover-page">
+            <div class="cover-header">
+                <div class="cover-logo">PharmAssist Intelligence</div>
+                <h1 class="cover-title">Pharmaceutical<br/>Intelligence Report</h1>
+                <p class="cover-subtitle">Comprehensive Drug Repurposing & Market Analysis</p>
+            </div>
+            
+            <div class="cover-content">
+                <div class="cover-drug-box">$drug_name</div>
+                <p class="cover-indication">▸ $indication_display</p>
+            </div>
+            
+            <div class="cover-footer">
+                <div class="cover-info-box">
+                    <p class="cover-info-item"><strong>Report Date:</strong> $report_date</p>
+                    <p class="cover-info-item"><strong>Generated by:</strong> PharmAssist Multi-Agent System</p>
+                    <p class="cover-info-item" style="margin-top: 12px; font-size: 11px; opacity: 0.7;">Confidential — For Internal Use Only</p>
+                </div>
+            </div>
+        </div>
+        
+        <div class="page-break"></div>
+        """)
+
+_EXECUTIVE_SUMMARY_TEMPLATE = Template("""
+        <div class="executive-summary">
+            <div class="section-header">
+                <div class="section-icon" style="--agent-from: #7c3aed; --agent-to: #6366f1; box-shadow: var(--shadow-md);">📊</div>
+                <div>
+                    <h2 class="section-title">Executive Summary</h2>
+                    <p class="section-subtitle">Key findings and strategic recommendation</p>
+                </div>
+            </div>
+            
+            <div class="opportunity-score-card">
+                <p class="opportunity-score-label">Overall Opportunity Score</p>
+                <div class="opportunity-score-value $score_class">$score<span class="opportunity-score-max">/100</span></div>
+            </div>
+            
+            <div class="key-takeaways">
+                <h3>🎯 Key Takeaways</h3>
+                <ul>
+                    $takeaways_html
+                </ul>
+            </div>
+            
+            <div class="recommendation-card $rec_class">
+                <p class="recommendation-label">▸ Strategic Recommendation</p>
+                <p class="recommendation-text">$recommendation</p>
+            </div>
+        </div>
+        """)
+
+_IQVIA_SECTION_TEMPLATE = Template(f"""
+        <div class="section">
+            <div class="section-header">
+                <div class="section-icon" style="{_AGENT_TONE_STYLE['iqvia']}">📈</div>
+                <div>
+                    <h2 class="section-title">Market Intelligence</h2>
+                    <p class="section-subtitle">IQVIA Insights — Market size, growth & competitive analysis</p>
+                </div>
+            </div>
+            
+            $summary_html
+            $metrics_html
+            $forecast_html
+            $competitive_html
+            $articles_html
+        </div>
+        """)
+
+_CLINICAL_SECTION_TEMPLATE = Template(f"""
+        <div class="section">
+            <div class="section-header">
+                <div class="section-icon" style="{_AGENT_TONE_STYLE['clinical']}">🧬</div>
+                <div>
+                    <h2 class="section-title">Clinical Landscape</h2>
+                    <p class="section-subtitle">Clinical Trials — Pipeline analysis & trial intelligence</p>
+                </div>
+            </div>
+            
+            $overview_html
+            $phase_html
+            $sponsor_html
+        </div>
+        """)
+
+# Section shells that are only a header plus a column of slots are joined
+# directly: one str.join with the total length known up front.
+_SECTION_SLOT_SEP = "\n            "
+_SECTION_CLOSE = "\n        </div>\n        "
+
+
+def _section_html(head: str, parts: tuple, close: str = _SECTION_CLOSE) -> str:
+    """Assemble a section from its static header, slot fragments and closing markup."""
+    return "".join((head, _SECTION_SLOT_SEP, _SECTION_SLOT_SEP.join(parts), close))
+
+
+_PATENT_SECTION_HEAD = f"""
+        <div class="section">
+            <div class="section-header">
+                <div class="section-icon" style="{_AGENT_TONE_STYLE['patent']}">🛡️</div>
+                <div>
+                    <h2 class="section-title">IP & Patent Analysis</h2>
+                    <p class="section-subtitle">Patent Landscape — FTO assessment & IP strategy</p>
+                </div>
+            </div>
+            """
+
+_EXIM_SECTION_HEAD = f"""
+        <div class="section">
+            <div class="section-header">
+                <div class="section-icon" style="{_AGENT_TONE_STYLE['exim']}">🌍</div>
+                <div>
+                    <h2 class="section-title">Trade & Supply Chain</h2>
+                    <p class="section-subtitle">EXIM Analysis — Export-import trends & sourcing intelligence</p>
+                </div>
+            </div>
+            """
+
+_INTERNAL_SECTION_HEAD = f"""
+        <div class="section">
+            <div class="section-header">
+                <div class="section-icon" style="{_AGENT_TONE_STYLE['internal']}">📚</div>
+                <div>
+                    <h2 class="section-title">Internal Knowledge</h2>
+                    <p class="section-subtitle">Company Intelligence — Prior research & strategic insights</p>
+                </div>
+            </div>
+            """
+
+_WEB_INTEL_SECTION_HEAD = f"""
+        <div class="section">
+            <div class="section-header">
+                <div class="section-icon" style="{_AGENT_TONE_STYLE['web']}">🌐</div>
+                <div>
+                    <h2 class="section-title">External Intelligence</h2>
+                    <p class="section-subtitle">Web Intelligence — News, sentiment & market buzz</p>
+                </div>
+            </div>
+            """
+_WEB_INTEL_SECTION_TAIL = """
+            
+            <div style="text-align: right; margin-top: 16px;">
+                <span class="badge %s">Confidence: %s</span>
+            </div>
+        </div>
+        """
+
+# IQVIA headline metric cards: (label, data key, value prefix, unit, show growth trend).
+# Values are numbers, formatted to one decimal before they reach the card
+# template, so they skip HTML escaping.
+_IQVIA_METRIC_SPECS = (
+    ("Market Size (2027)", "marketSizeUSD", "$", "B", False),
+    ("Current Market", "startMarketSize", "$", "B", False),
+    ("CAGR", "cagrPercent", "", "%", True),
+    ("Total Growth", "totalGrowthPercent", "", "%", False),
+)
+
+# Opportunity score bands: score >= 50 is medium/moderate, >= 75 is high/strong
+_SCORE_BREAKS = (50, 75)
+_SCORE_CLASSES = ("low", "medium", "high")
+_REC_CLASSES = ("limited", "moderate", "strong")
+
+# Growth trend arrow: CAGR above 5% reads as "up"
+_TREND_BREAKS = (5,)
+_TREND_HTML = tuple(
+    f'<p class="metric-trend {trend}">{arrow} Growth</p>'
+    for trend, arrow in (("neutral", "→"), ("up", "↑"))
+)
+
+# IQVIA summary answers read like "Yes — High Growth" / "Possibly — Stable Market";
+# the first keyword found decides the banner colour, anything else is negative.
+_IQVIA_ANSWER_CLASS = {"yes": "positive", "high": "positive", "stable": "neutral"}
+
+
+@functools.lru_cache(maxsize=256)
+def _iqvia_answer_class(answer: str) -> str:
+    """Banner class for an IQVIA answer; the agent repeats a handful of phrasings."""
+    return next(
+        (cls for word in answer.lower().split() if (cls := _IQVIA_ANSWER_CLASS.get(word))),
+        "negative",
+    )
+
+
+# Per-section answer/label -> CSS class tables; callers pass the fallback
+# class for unlisted values to .get()
+_FTO_STATUS_CLASS = {"CLEAR": "positive", "AT_RISK": "neutral"}
+_FEASIBILITY_CLASS = {"HIGH": "positive", "MEDIUM": "neutral"}
+_EXIM_ANSWER_CLASS = {"Yes": "positive", "Active": "positive", "Stable": "neutral"}
+_INTERNAL_ANSWER_CLASS = {"Yes": "positive", "Strong": "positive"}
+_WEB_ANSWER_CLASS = {
+    "Positive": "positive", "Favorable": "positive", "Neutral": "neutral", "Mixed": "neutral",
+}
+_SIGNAL_LABEL_CLASS = {"HIGH": "high", "MEDIUM": "medium", "MODERATE": "medium"}
+_CONFIDENCE_CLASS = {"HIGH": "low", "MEDIUM": "medium", "LOW": "high"}
+
+_METRIC_CARD_HTML = '<div class="metric-card"><p class="metric-label">{label}</p><p class="metric-value">{value}<span class="metric-unit">{unit}</span></p>{trend}</div>'
+
+# IQVIA market-leader card: (therapy, share)
+_LEADER_CARD_HTML = '<div class="metric-card"><p class="metric-label">Market Leader</p><p class="metric-value" style="font-size: 18px;">%s</p><p class="metric-trend neutral">%s</p></div>'
+
+# Plain label/value metric card: (label, value-attrs, value, unit-html)
+_SIMPLE_METRIC_CARD_HTML = '<div class="metric-card"><p class="metric-label">%s</p><p class="metric-value"%s>%s%s</p></div>'
+_METRIC_UNIT_HTML = '<span class="metric-unit">%s</span>'
+_COMPACT_VALUE_STYLE = ' style="font-size: 16px;"'
+
+
+# Bound %-formatters: map() drives them per item without Python-level loop bytecode
+_EXPLAINER_HTML = '<span class="summary-explainer">%s</span>'.__mod__
+_NEWS_TAG_HTML = '<span class="summary-explainer" style="font-size: 10px;">%s</span>'.__mod__
+_WHY_ITEM_HTML = '<li style="color: var(--text-muted); font-size: 12px; margin: 4px 0;">%s</li>'.__mod__
+_TAKEAWAY_HTML = '<li>%s</li>'.__mod__
+_RECOMMENDATION_ITEM_HTML = '<li style="margin-bottom: 8px; color: var(--text); font-size: 13px;">%s</li>'.__mod__
+_REFERENCE_CHIP_HTML = '<span class="summary-explainer" style="display: inline-block; margin: 4px;">📄 %s</span>'.__mod__
+
+
+def _explainers_html(explainers: List[Any]) -> str:
+    """Space-separated, escaped summary-explainer chips."""
+    return " ".join(map(_EXPLAINER_HTML, map(escape, map(str, explainers))))
+
+
+_SUMMARY_BANNER_TEMPLATE = Template("""
+            <div class="summary-banner" style="$tone">
+                <p class="summary-question">$question</p>
+                <p class="summary-answer $answer_class">$answer</p>
+                <div class="summary-explainers">$explainers_html</div>
+            </div>
+            """)
+
+
+def _summary_banner(agent: str, question: str, answer_class: str, answer: Any, explainers: List[Any]) -> str:
+    """Agent summary banner; question and answer are escaped here."""
+    return _SUMMARY_BANNER_TEMPLATE.substitute(
+        tone=_AGENT_TONE_STYLE[agent],
+        question=escape(question),
+        answer_class=answer_class,
+        answer=escape(str(answer)),
+        explainers_html=_explainers_html(explainers),
+    )
+
+
+@dataclass(slots=True)
+class _PatentView:
+    """Flat, typed view of the patent agent payload, extracted in one pass."""
+    fto_status: Any = "UNKNOWN"
+    patents_found: Any = 0
+    risk_level: Any = 0
+    has_blocking_summary: bool = False
+    blocking_count: Any = 0
+    actions: List[Dict] = field(default_factory=list)
+    executive: Any = ""
+    business: Any = ""
+    
+    @classmethod
+    def from_section(cls, patent: Dict) -> "_PatentView":
+        """Build from data["patent"], unwrapping the agent's optional "data" envelope."""
+        actual_data = patent.get("data", patent)
+        get = actual_data.get
+        blocking_summary = get("blockingPatentsSummary", {})
+        summary_layers = get("summaryLayers") or {}
+        return cls(
+            fto_status=get("ftoStatus", "UNKNOWN"),
+            patents_found=get("patentsFound", 0),
+            risk_level=get("normalizedRiskInternal", 0),
+            has_blocking_summary=bool(blocking_summary),
+            blocking_count=blocking_summary.get("count", 0) if blocking_summary else 0,
+            actions=get("recommendedActions", []),
+            executive=summary_layers.get("executive", ""),
+            business=summary_layers.get("business", ""),
+        )
+
+
+def _metric_card(label: str, value: Any, unit: str = "", style: str = "") -> str:
+    """Render one plain metric card; style is a ready-made attribute string such as _COMPACT_VALUE_STYLE."""
+    return _SIMPLE_METRIC_CARD_HTML % (label, style, value, _METRIC_UNIT_HTML % unit if unit else "")
+
+
+# Row field extraction: merge the row over its defaults, then pull every
+# field with one C-level itemgetter call (same result as per-key .get(k, d))
+_PATENT_ACTION_DEFAULTS = {"action": "", "reason": "", "feasibility": "MEDIUM"}
+_PATENT_ACTION_FIELDS = operator.itemgetter(*_PATENT_ACTION_DEFAULTS)
+
+_TRADE_ROW_DEFAULTS = {
+    "Country": "Unknown", "2024 - 2025": "N/A", "2023 - 2024": "N/A", "%Share": "N/A", "%Growth": "0",
+}
+_TRADE_ROW_FIELDS = operator.itemgetter(*_TRADE_ROW_DEFAULTS)
+
+_NEWS_ITEM_DEFAULTS = {"title": "", "source": "", "publishedAt": "", "snippet": "", "tags": []}
+_NEWS_ITEM_FIELDS = operator.itemgetter(*_NEWS_ITEM_DEFAULTS)
+
+# Fixed-shape table rows / list items, filled with % so each row is one C-level format
+_PATENT_ACTION_ROW_HTML = """
+                <tr>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td class="%s">%s</td>
+                </tr>
+                """
+
+_TRADE_ROW_HTML = """
+                <tr>
+                    <td>%s</td>
+                    <td>$%sM</td>
+                    <td>$%sM</td>
+                    <td>%s%%</td>
+                    <td style="color: %s; font-weight: 600;">%s%%</td>
+                </tr>
+                """
+
+# Trade growth colour indexed by sign(growth) + 1: negative, flat, positive
+_GROWTH_COLORS = ("var(--danger)", "var(--text-muted)", "var(--success)")
+
+_FINDING_CARD_HTML = """
+                <div class="metric-card finding-card">
+                    <p class="metric-label">Finding #%d</p>
+                    <p class="finding-card-text">%s</p>
+                </div>
+                """
+
+_IQVIA_ARTICLE_HTML = """
+                <div class="news-card iqvia">
+                    <p class="news-card-title">%s</p>
+                    <p class="news-card-meta">
+                        <span class="news-card-source">%s</span>
+                    </p>
+                    %s
+                </div>
+                """
+
+_NEWS_SNIPPET_HTML = '<p class="news-card-snippet">%s...</p>'
+
+_CLINICAL_PHASE_CARD_HTML = """
+                <div class="metric-card">
+                    <p class="metric-label">%s</p>
+                    <p class="metric-value">~%s<span class="metric-unit">trials</span></p>
+                    <p class="metric-trend neutral"><span class="status-dot %s"></span>Active</p>
+                </div>
+                """
+
+_CLINICAL_SPONSOR_ROW_HTML = """
+                    <tr>
+                        <td>%s</td>
+                        <td style="color: var(--clinical);">~%s</td>
+                        <td>Clinical Research</td>
+                    </tr>
+                    """
+
+# Containers around the looped items above, bound once per section
+_IQVIA_ARTICLES_TEMPLATE = Template("""
+            <div class="chart-container" style="margin-top: 16px;">
+                <p class="chart-title">Market Research & Reports</p>
+                $items
+            </div>
+            """)
+
+_CLINICAL_PHASES_TEMPLATE = Template("""
+            <div class="chart-container">
+                <p class="chart-title">Clinical Trial Phase Distribution</p>
+                <div class="metrics-grid">$cards</div>
+                <p style="color: var(--text-muted); font-size: 13px; margin-top: 16px;">Total trials analyzed: $total_trials</p>
+            </div>
+            """)
+
+_CLINICAL_SPONSORS_TEMPLATE = Template("""
+                <div class="data-table-container">
+                    <p class="data-table-title">Top Clinical Trial Sponsors</p>
+                    <table class="data-table">
+                        <thead>
+                            <tr>
+                                <th>Sponsor</th>
+                                <th>Trials</th>
+                                <th>Focus Area</th>
+                            </tr>
+                        </thead>
+                        <tbody>$rows</tbody>
+                    </table>
+                </div>
+                """)
+
+_NEWS_ITEM_HTML = """
+                <div class="news-card">
+                    <p class="news-card-title">%s</p>
+                    <p class="news-card-meta">
+                        <span class="news-card-source">%s</span>
+                        %s
+                    </p>
+                    %s
+                    %s
+                </div>
+                """
+
+
+# ============================================
+# SECTION RENDER CACHE
+# ============================================
+
+class _RenderCache:
+    """Thread-safe bounded LRU of rendered HTML fragments."""
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+            return html
+    
+    def put(self, key: tuple, html: str) -> None:
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_SECTION_CACHE = _RenderCache(maxsize=256)
+
+
+def _dumps_sorted(value: Any) -> bytes:
+    """Deterministic JSON bytes (sorted keys); uses orjson when installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    import json  # only needed without orjson
+    return json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+
+
+def _data_digest(value: Any) -> bytes:
+    """Stable digest of JSON-like render input (key order independent)."""
+    return hashlib.blake2b(_dumps_sorted(value), digest_size=16).digest()
+
+
+def _cached_render(select: Optional[Callable[..., Any]] = None):
     """
-    HTML Template Generator for Pharmaceutical Intelligence Reports.
+    Memoize a render method on a digest of its input.
     
-    Produces professional pharmaceutical reports with:
-    - Cover page with drug/indication branding
-    - Executive summary with key metrics
-    - All 6 agent data sections
-    - Strategic recommendations
-    - Print-ready PDF styling
+    Args:
+        select: Optional function picking the slice of the arguments the
+            renderer actually reads; defaults to all positional arguments.
+    """
+    def decorator(method):
+        name = method.__name__
+        
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            try:
+                key = (name, _data_digest(select(*args) if select else args))
+            except (TypeError, ValueError):
+                return method(self, *args)
+            html = _SECTION_CACHE.get(key)
+            if html is None:
+                html = method(self, *args)
+                _SECTION_CACHE.put(key, html)
+            return html
+        return wrapper
+    return decorator
+
+
+def _first(d: Dict, *keys: str, default: Any = "") -> Any:
+    """Value of the first key present in d, else default; no fallback lookup when an earlier key hits."""
+    for key in keys:
+        if key in d:
+            return d[key]
+    return default
+
+
+def _ellipsize(text: str, limit: int) -> str:
+    """Truncate text to limit characters plus "...", leaving short text uncopied."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# ============================================
+# CRITICAL CSS SPLIT
+# ============================================
+# Rules the cover page and executive summary need for first paint; the rest
+# of the stylesheet is loaded without blocking rendering.
+
+_CRITICAL_CSS_PREFIXES = (
+    "@import", "@font-face", "@keyframes", ":root", "*", "html", "body",
+    "h1", "h2", "h3", "h4", "h5", "h6", "p", "strong", "a",
+    ".report-container", ".cover-", ".executive-summary", ".opportunity-score",
+    ".key-takeaways", ".recommendation-", ".section",
+)
+
+# Scoped chrome rules (".report-container ::selection") never affect first paint
+_DEFERRED_CSS_PSEUDOS = ("::-webkit-scrollbar", "::selection", "::-moz-selection")
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SELECTOR_RE = re.compile(r"[^,{]*")
+
+
+@functools.lru_cache(maxsize=4)
+def _split_critical_css(css: str) -> tuple:
     """
+    Partition a stylesheet into (critical, deferred) by top-level rule.
     
-    # Color scheme matching frontend
-    COLORS = {
-        "primary": "#1e40af",
-        "primary_light": "#3b82f6",
-        "secondary": "#7c3aed",
-        "secondary_light": "#a78bfa",
-        "iqvia": "#3b82f6",         # blue
-        "clinical": "#10b981",      # emerald
-        "patent": "#f59e0b",        # amber
-        "exim": "#14b8a6",          # teal
-        "internal": "#ec4899",      # pink
-        "web": "#06b6d4",           # cyan
-        "report": "#8b5cf6",        # violet
-        "success": "#10b981",
-        "warning": "#f59e0b",
-        "danger": "#ef4444",
-        "neutral": "#6b7280",
-        "background": "#0f172a",
-        "card": "#1e293b",
-        "border": "#334155",
-        "text": "#f8fafc",
-        "text_muted": "#94a3b8",
-    }
+    Rules keep their original relative order within each half. Comments stay
+    attached to the rule that follows them; quoted strings are skipped so a
+    ';' inside url('...') does not end an @import.
+    """
+    critical: List[str] = []
+    deferred: List[str] = []
+    depth = 0
+    start = 0
+    i = 0
+    n = len(css)
     
-    # Chart colors matching frontend palette
-    CHART_COLORS = [
-        "#003f5c", "#2f4b7c", "#665191", "#a05195",
-        "#d45087", "#f95d6a", "#ff7c43", "#ffa600"
-    ]
+    while i < n:
+        if css.startswith("/*", i):
+            end = css.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+            continue
+        ch = css[i]
+        i += 1
+        if ch in "'\"":
+            end = css.find(ch, i)
+            i = n if end < 0 else end + 1
+        elif ch == "{":
+            depth += 1
+        elif ch == ";" and depth == 0 or ch == "}" and depth == 1:
+            depth = 0
+            rule = css[start:i]
+            start = i
+            selector = _CSS_SELECTOR_RE.match(_CSS_COMMENT_RE.sub("", rule).lstrip()).group()
+            is_critical = selector.startswith(_CRITICAL_CSS_PREFIXES) and not any(
+                pseudo in selector for pseudo in _DEFERRED_CSS_PSEUDOS
+            )
+            (critical if is_critical else deferred).append(rule)
+        elif ch == "}":
+            depth -= 1
     
-    def __init__(self):
-        self.css = self._generate_css()
-        
-    def _generate_css(self) -> str:
-        """Generate comprehensive CSS for the report - Production-grade aesthetic"""
-        return """
+    deferred.append(css[start:])
+    return "".join(critical), "".join(deferred)
+
+
+# ============================================
+# THEME TOKEN RESOLUTION
+# ============================================
+# The theme is static, so var(--token) references to the :root palette are
+# replaced with their literal values once. :root itself is kept for the
+# inline style="" attributes emitted by the section renderers.
+
+_CSS_ROOT_BLOCK_RE = re.compile(r":root\s*\{(.*?)\}", re.S)
+_CSS_CUSTOM_PROPERTY_RE = re.compile(r"--([\w-]+)\s*:\s*([^;]+?)\s*;", re.ASCII)
+_CSS_VAR_RE = re.compile(r"var\(--([\w-]+)\)", re.ASCII)
+
+
+def _resolve_theme_tokens(css: str) -> str:
+    """Substitute var(--token) after the first :root block with its literal value."""
+    root = _CSS_ROOT_BLOCK_RE.search(css)
+    if root is None:
+        return css
+    tokens = dict(_CSS_CUSTOM_PROPERTY_RE.findall(_CSS_COMMENT_RE.sub("", root.group(1))))
+    rest = _CSS_VAR_RE.sub(lambda m: tokens.get(m.group(1), m.group(0)), css[root.end():])
+    return css[:root.end()] + rest
+
+
+# ============================================
+# MEDIA TYPE FLATTENING
+# ============================================
+# PDF output is always print media, so its stylesheet unwraps the
+# @media print blocks and drops the @media screen ones.
+# Width queries are left alone: they still depend on the paper size.
+
+_CSS_MEDIA_TYPE_RE = re.compile(r"@media\s+(print|screen)\s*\{")
+
+
+def _apply_media_type(css: str, medium: str) -> str:
+    """Inline top-level @media <medium> blocks and remove the other media type's blocks"""
+    parts = []
+    pos = 0
+    while (match := _CSS_MEDIA_TYPE_RE.search(css, pos)) is not None:
+        depth = 1
+        i = match.end()
+        while depth:
+            depth += (css[i] == "{") - (css[i] == "}")
+            i += 1
+        parts.append(css[pos:match.start()])
+        if match.group(1) == medium:
+            parts.append(css[match.end():i - 1])
+        pos = i
+    parts.append(css[pos:])
+    return "".join(parts)
+
+
+# Pointer-driven state never occurs on paper: print output also drops rules
+# whose selectors are all :hover/:focus states, and every transition.
+_CSS_INNER_RULE_RE = re.compile(r"([^{}]*)\{([^{}]*)\}")
+_CSS_INTERACTIVE_PSEUDO_RE = re.compile(r":(?:hover|focus(?:-within|-visible)?|active)\b")
+_CSS_TRANSITION_RE = re.compile(r"\s*(?<![\w-])transition(?:-[\w-]+)?\s*:[^;]*;?", re.ASCII)
+
+
+def _strip_interactive_rules(css: str) -> str:
+    """Remove interactive-only rules and transition declarations (and rules left empty)"""
+    def strip(match: re.Match) -> str:
+        selector_text, body = match.groups()
+        selectors = _CSS_COMMENT_RE.sub("", selector_text).split(",")
+        if all(_CSS_INTERACTIVE_PSEUDO_RE.search(selector) for selector in selectors):
+            return ""
+        body = _CSS_TRANSITION_RE.sub("", body)
+        return f"{selector_text}{{{body}}}" if body.strip() else ""
+    return _CSS_INNER_RULE_RE.sub(strip, css)
+
+
+# ============================================
+# CSS MINIFICATION
+# ============================================
+# rcssmin when installed; otherwise a conservative, string-aware pass that
+# drops comments and whitespace that cannot be significant (around braces,
+# semicolons, commas and child combinators). Descendant-combinator spaces and
+# everything inside quotes are preserved.
+
+_CSS_STRING_PATTERN = r"""("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')"""
+_CSS_STRIP_COMMENTS_RE = re.compile(_CSS_STRING_PATTERN + r"|/\*.*?\*/", re.S)
+_CSS_COLLAPSE_RE = re.compile(_CSS_STRING_PATTERN + r"|\s*;\s*(})\s*|\s*([{};,>])\s*|\s+")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    if HAS_RCSSMIN:
+        return rcssmin.cssmin(css)
+    css = _CSS_STRIP_COMMENTS_RE.sub(lambda m: m.group(1) or "", css)
+    return _CSS_COLLAPSE_RE.sub(
+        lambda m: m.group(1) or m.group(2) or m.group(3) or " ", css
+    ).strip()
+
+
+# ============================================
+# REPORT STYLESHEET
+# ============================================
+
+# Logical blocks in cascade order. "base" carries the :root theme the other
+# blocks are resolved against, so it is always emitted.
+_CSS_BLOCKS = (
+    ("base", """
         /* ============================================
            PHARMASSIST INTELLIGENCE REPORT
            Production-Grade Template | 2026
            Aesthetic: Cinematic Dark Pharmaceutical
            ============================================ */
         
-        @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;500;600;700;800&family=DM+Sans:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
-        
         :root {
             /* Core Brand - Midnight Pharma with Electric Accents */
             --primary: #0369a1;
@@ -159,17 +847,6 @@ class PharmReportTemplate:
                 font-size: 12px;
             }
             
-            :root {
-                --background: #030712 !important;
-                --background-elevated: #0a0f1a !important;
-                --surface: #111827 !important;
-                --surface-light: #1f2937 !important;
-                --border: #374151 !important;
-                --text: #f9fafb !important;
-                --text-secondary: #e5e7eb !important;
-                --text-muted: #9ca3af !important;
-            }
-            
             .page-break {
                 page-break-before: always;
                 break-before: page;
@@ -178,7 +855,8 @@ class PharmReportTemplate:
             .no-print { display: none !important; }
             .section { break-inside: avoid; }
         }
-        
+        """),
+    ("layout", """
         /* ============================================
            LAYOUT CONTAINER
            ============================================ */
@@ -200,8 +878,15 @@ class PharmReportTemplate:
                 border: 1px solid var(--border-subtle);
                 background: linear-gradient(180deg, var(--background-elevated) 0%, var(--background) 100%);
             }
+            
+            /* Off-screen charts skip layout/paint until scrolled near */
+            .chart-container {
+                content-visibility: auto;
+                contain-intrinsic-size: auto 320px;
+            }
         }
-        
+        """),
+    ("cover", """
         /* ============================================
            COVER PAGE - Cinematic Dark
            ============================================ */
@@ -391,7 +1076,8 @@ class PharmReportTemplate:
             color: var(--text);
             font-weight: 600;
         }
-        
+        """),
+    ("executive", """
         /* ============================================
            EXECUTIVE SUMMARY - Hero Section
            ============================================ */
@@ -561,7 +1247,8 @@ class PharmReportTemplate:
             color: var(--text);
             line-height: 1.7;
         }
-        
+        """),
+    ("section", """
         /* ============================================
            SECTION HEADERS - Editorial Style
            ============================================ */
@@ -597,7 +1284,9 @@ class PharmReportTemplate:
             justify-content: center;
             font-size: 28px;
             flex-shrink: 0;
-            box-shadow: var(--shadow-md);
+            background: linear-gradient(135deg, var(--agent-from) 0%, var(--agent-to) 100%);
+            color: white;
+            box-shadow: 0 8px 24px rgba(var(--agent-rgb), 0.3);
             position: relative;
         }
         
@@ -610,37 +1299,6 @@ class PharmReportTemplate:
             pointer-events: none;
         }
         
-        .section-icon.iqvia { 
-            background: linear-gradient(135deg, var(--iqvia) 0%, #0891b2 100%);
-            color: white;
-            box-shadow: 0 8px 24px rgba(6, 182, 212, 0.3);
-        }
-        .section-icon.clinical { 
-            background: linear-gradient(135deg, var(--clinical) 0%, #10b981 100%);
-            color: white;
-            box-shadow: 0 8px 24px rgba(52, 211, 153, 0.3);
-        }
-        .section-icon.patent { 
-            background: linear-gradient(135deg, var(--patent) 0%, #f59e0b 100%);
-            color: white;
-            box-shadow: 0 8px 24px rgba(251, 191, 36, 0.3);
-        }
-        .section-icon.exim { 
-            background: linear-gradient(135deg, var(--exim) 0%, #14b8a6 100%);
-            color: white;
-            box-shadow: 0 8px 24px rgba(45, 212, 191, 0.3);
-        }
-        .section-icon.internal { 
-            background: linear-gradient(135deg, var(--internal) 0%, #ec4899 100%);
-            color: white;
-            box-shadow: 0 8px 24px rgba(244, 114, 182, 0.3);
-        }
-        .section-icon.web { 
-            background: linear-gradient(135deg, var(--web) 0%, #0ea5e9 100%);
-            color: white;
-            box-shadow: 0 8px 24px rgba(56, 189, 248, 0.3);
-        }
-        
         .section-title {
             font-family: 'Playfair Display', serif;
             font-size: 32px;
@@ -655,7 +1313,8 @@ class PharmReportTemplate:
             color: var(--text-muted);
             font-weight: 400;
         }
-        
+        """),
+    ("banner", """
         /* ============================================
            SUMMARY BANNERS - Signal Cards
            ============================================ */
@@ -677,15 +1336,10 @@ class PharmReportTemplate:
             left: 0;
             width: 4px;
             height: 100%;
+            background: var(--agent-from);
+            box-shadow: 0 0 15px var(--agent-from);
         }
         
-        .summary-banner.iqvia::before { background: var(--iqvia); box-shadow: 0 0 15px var(--iqvia); }
-        .summary-banner.clinical::before { background: var(--clinical); box-shadow: 0 0 15px var(--clinical); }
-        .summary-banner.patent::before { background: var(--patent); box-shadow: 0 0 15px var(--patent); }
-        .summary-banner.exim::before { background: var(--exim); box-shadow: 0 0 15px var(--exim); }
-        .summary-banner.internal::before { background: var(--internal); box-shadow: 0 0 15px var(--internal); }
-        .summary-banner.web::before { background: var(--web); box-shadow: 0 0 15px var(--web); }
-        
         .summary-question {
             font-family: 'DM Sans', sans-serif;
             font-size: 11px;
@@ -738,7 +1392,62 @@ class PharmReportTemplate:
             background: var(--surface-hover);
             color: var(--text-secondary);
         }
+        """),
+    ("news", """
+        /* ============================================
+           NEWS & FINDING CARDS - emitted once per item,
+           so styling lives here rather than inline
+           ============================================ */
+        .news-card {
+            --variant-color: var(--web);
+            --variant-rgb: 6, 182, 212;
+            padding: 12px;
+            background: rgba(var(--variant-rgb), 0.05);
+            border: 1px solid rgba(var(--variant-rgb), 0.2);
+            border-radius: 8px;
+            margin-bottom: 8px;
+        }
+        
+        .news-card.iqvia {
+            --variant-color: var(--iqvia);
+            --variant-rgb: 93, 99, 255;
+        }
+        
+        .news-card-title {
+            font-size: 13px;
+            font-weight: 500;
+            color: var(--text);
+            margin-bottom: 4px;
+        }
         
+        .news-card-meta {
+            font-size: 11px;
+            color: var(--text-muted);
+            margin-bottom: 6px;
+        }
+        
+        .news-card-source { color: var(--variant-color); }
+        
+        .news-card-snippet {
+            font-size: 12px;
+            color: var(--text-muted);
+        }
+        
+        .news-card.iqvia .news-card-meta { margin-bottom: 0; }
+        .news-card.iqvia .news-card-snippet { margin-top: 6px; }
+        
+        .finding-card {
+            min-width: 100%;
+            margin-bottom: 12px;
+        }
+        
+        .finding-card-text {
+            font-size: 13px;
+            color: var(--text);
+            line-height: 1.5;
+        }
+        """),
+    ("metric", """
         /* ============================================
            METRIC CARDS - Data Visualization
            ============================================ */
@@ -790,7 +1499,8 @@ class PharmReportTemplate:
             font-weight: 400;
             margin-left: 2px;
         }
-        
+        """),
+    ("table", """
         /* ============================================
            DATA TABLES - Cinematic Dark
            ============================================ */
@@ -849,7 +1559,8 @@ class PharmReportTemplate:
         .data-table tbody tr:last-child td {
             border-bottom: none;
         }
-        
+        """),
+    ("badge", """
         /* ============================================
            STATUS BADGES - Glowing Dark
            ============================================ */
@@ -865,56 +1576,18 @@ class PharmReportTemplate:
             text-transform: uppercase;
             letter-spacing: 0.5px;
             white-space: nowrap;
-        }
-        
-        .badge.success {
-            background: rgba(52, 211, 153, 0.15);
-            color: var(--success);
-            border: 1px solid rgba(52, 211, 153, 0.3);
-            box-shadow: 0 0 12px rgba(52, 211, 153, 0.15);
-        }
-        
-        .badge.warning {
-            background: rgba(251, 191, 36, 0.15);
-            color: var(--warning);
-            border: 1px solid rgba(251, 191, 36, 0.3);
-            box-shadow: 0 0 12px rgba(251, 191, 36, 0.15);
-        }
-        
-        .badge.danger {
-            background: rgba(248, 113, 113, 0.15);
-            color: var(--danger);
-            border: 1px solid rgba(248, 113, 113, 0.3);
-            box-shadow: 0 0 12px rgba(248, 113, 113, 0.15);
-        }
-        
-        .badge.neutral {
-            background: rgba(148, 163, 184, 0.15);
-            color: var(--neutral);
-            border: 1px solid rgba(148, 163, 184, 0.3);
-        }
-        
-        .badge.iqvia {
-            background: rgba(6, 182, 212, 0.15);
-            color: var(--iqvia);
-            border: 1px solid rgba(6, 182, 212, 0.3);
-            box-shadow: 0 0 12px rgba(6, 182, 212, 0.15);
-        }
-        
-        .badge.clinical {
-            background: rgba(52, 211, 153, 0.15);
-            color: var(--clinical);
-            border: 1px solid rgba(52, 211, 153, 0.3);
-            box-shadow: 0 0 12px rgba(52, 211, 153, 0.15);
-        }
-        
-        .badge.patent {
-            background: rgba(251, 191, 36, 0.15);
-            color: var(--patent);
-            border: 1px solid rgba(251, 191, 36, 0.3);
-            box-shadow: 0 0 12px rgba(251, 191, 36, 0.15);
-        }
-        
+            background: rgba(var(--tone-rgb), 0.15);
+            color: var(--tone);
+            border: 1px solid rgba(var(--tone-rgb), 0.3);
+            box-shadow: 0 0 12px rgba(var(--tone-rgb), 0.15);
+        }
+        
+        .badge.success { --tone: var(--success); --tone-rgb: 52, 211, 153; }
+        .badge.warning { --tone: var(--warning); --tone-rgb: 251, 191, 36; }
+        .badge.danger { --tone: var(--danger); --tone-rgb: 248, 113, 113; }
+        .badge.neutral { --tone: var(--neutral); --tone-rgb: 148, 163, 184; box-shadow: none; }
+        """),
+    ("content_card", """
         /* ============================================
            CONTENT CARDS - Glass Dark
            ============================================ */
@@ -954,16 +1627,30 @@ class PharmReportTemplate:
             color: var(--text-secondary);
             line-height: 1.7;
         }
-        
+        """),
+    ("accent_card", """
         /* ============================================
-           CLINICAL TRIAL CARDS
+           ACCENTED CARDS - trial & patent variants
+           share one rule set keyed on --variant-*
            ============================================ */
         .trial-card {
+            --variant-color: var(--clinical);
+            --variant-hover: var(--success);
+            --variant-rgb: 52, 211, 153;
+        }
+        
+        .patent-card {
+            --variant-color: var(--patent);
+            --variant-hover: var(--accent-warm);
+            --variant-rgb: 251, 191, 36;
+        }
+        
+        .trial-card, .patent-card {
             background: 
-                linear-gradient(135deg, rgba(52, 211, 153, 0.04) 0%, transparent 100%),
+                linear-gradient(135deg, rgba(var(--variant-rgb), 0.04) 0%, transparent 100%),
                 var(--surface);
             border: 1px solid var(--border);
-            border-left: 4px solid var(--clinical);
+            border-left: 4px solid var(--variant-color);
             border-radius: 0 20px 20px 0;
             padding: 28px;
             margin-bottom: 20px;
@@ -971,10 +1658,15 @@ class PharmReportTemplate:
             box-shadow: var(--shadow-inner);
         }
         
-        .trial-card:hover {
-            border-left-color: var(--success);
-            box-shadow: var(--shadow-sm), 0 0 20px rgba(52, 211, 153, 0.1);
+        .trial-card:hover, .patent-card:hover {
+            border-left-color: var(--variant-hover);
+            box-shadow: var(--shadow-sm), 0 0 20px rgba(var(--variant-rgb), 0.1);
         }
+        """),
+    ("trial", """
+        /* ============================================
+           CLINICAL TRIAL CARDS
+           ============================================ */
         
         .trial-card-header {
             display: flex;
@@ -1016,28 +1708,11 @@ class PharmReportTemplate:
             align-items: center;
             gap: 6px;
         }
-        
+        """),
+    ("patent", """
         /* ============================================
            PATENT CARDS
            ============================================ */
-        .patent-card {
-            background: 
-                linear-gradient(135deg, rgba(251, 191, 36, 0.04) 0%, transparent 100%),
-                var(--surface);
-            border: 1px solid var(--border);
-            border-left: 4px solid var(--patent);
-            border-radius: 0 20px 20px 0;
-            padding: 28px;
-            margin-bottom: 20px;
-            transition: all 0.3s ease;
-            box-shadow: var(--shadow-inner);
-        }
-        
-        .patent-card:hover {
-            border-left-color: var(--accent-warm);
-            box-shadow: var(--shadow-sm), 0 0 20px rgba(251, 191, 36, 0.1);
-        }
-        
         .patent-number {
             font-family: 'JetBrains Mono', monospace;
             font-size: 11px;
@@ -1067,7 +1742,8 @@ class PharmReportTemplate:
             color: var(--warning);
             font-weight: 600;
         }
-        
+        """),
+    ("typography", """
         /* ============================================
            TYPOGRAPHY - Refined Dark
            ============================================ */
@@ -1125,7 +1801,8 @@ class PharmReportTemplate:
             color: var(--accent);
             border: 1px solid var(--border-subtle);
         }
-        
+        """),
+    ("list", """
         /* ============================================
            LISTS - Enhanced Dark
            ============================================ */
@@ -1143,7 +1820,8 @@ class PharmReportTemplate:
         li::marker {
             color: var(--accent);
         }
-        
+        """),
+    ("footer", """
         /* ============================================
            FOOTER - Cinematic
            ============================================ */
@@ -1184,7 +1862,8 @@ class PharmReportTemplate:
             font-size: 11px;
             color: var(--text-faint);
         }
-        
+        """),
+    ("responsive", """
         /* ============================================
            RESPONSIVE - Dark Optimized
            ============================================ */
@@ -1231,42 +1910,45 @@ class PharmReportTemplate:
                 padding: 36px 32px;
             }
         }
-        
+        """),
+    ("scrollbar", """
         /* ============================================
            SCROLLBAR - Dark Theme
            ============================================ */
-        ::-webkit-scrollbar {
+        .report-container ::-webkit-scrollbar {
             width: 10px;
             height: 10px;
         }
         
-        ::-webkit-scrollbar-track {
+        .report-container ::-webkit-scrollbar-track {
             background: var(--background);
         }
         
-        ::-webkit-scrollbar-thumb {
+        .report-container ::-webkit-scrollbar-thumb {
             background: var(--surface-light);
             border-radius: 8px;
             border: 2px solid var(--background);
         }
         
-        ::-webkit-scrollbar-thumb:hover {
+        .report-container ::-webkit-scrollbar-thumb:hover {
             background: var(--surface-hover);
         }
-        
+        """),
+    ("selection", """
         /* ============================================
            SELECTION - Accent Highlight
            ============================================ */
-        ::selection {
+        .report-container ::selection {
             background: rgba(34, 211, 238, 0.3);
             color: var(--text);
         }
         
-        ::-moz-selection {
+        .report-container ::-moz-selection {
             background: rgba(34, 211, 238, 0.3);
             color: var(--text);
         }
-        
+        """),
+    ("chart", """
         /* Donut Chart Styling */
         .donut-chart-container {
             display: flex;
@@ -1276,31 +1958,28 @@ class PharmReportTemplate:
             padding: 20px 0;
         }
         
+        /* Fixed tracks: swatch | label | value, laid out in one pass */
         .donut-legend {
-            display: flex;
-            flex-direction: column;
+            display: grid;
+            grid-template-columns: 14px minmax(120px, 1fr) auto;
+            align-items: center;
             gap: 14px;
         }
         
         .donut-legend-item {
-            display: flex;
-            align-items: center;
-            gap: 14px;
+            display: contents;
         }
         
         .donut-legend-color {
             width: 14px;
             height: 14px;
             border-radius: 4px;
-            flex-shrink: 0;
         }
         
         .donut-legend-label {
             font-family: 'DM Sans', sans-serif;
             font-size: 13px;
             color: var(--text-secondary);
-            flex: 1;
-            min-width: 120px;
         }
         
         .donut-legend-value {
@@ -1309,7 +1988,8 @@ class PharmReportTemplate:
             font-weight: 600;
             color: var(--accent);
         }
-        
+        """),
+    ("recommendation", """
         /* ============================================
            STRATEGIC RECOMMENDATIONS
            ============================================ */
@@ -1370,7 +2050,8 @@ class PharmReportTemplate:
             color: var(--text-muted);
             line-height: 1.5;
         }
-        
+        """),
+    ("appendix", """
         /* ============================================
            APPENDIX & RAW DATA
            ============================================ */
@@ -1400,7 +2081,8 @@ class PharmReportTemplate:
             white-space: pre-wrap;
             line-height: 1.6;
         }
-        
+        """),
+    ("footer_refined", """
         /* ============================================
            FOOTER - Refined
            ============================================ */
@@ -1421,7 +2103,8 @@ class PharmReportTemplate:
         .report-footer strong {
             color: var(--text-secondary);
         }
-        
+        """),
+    ("utilities", """
         /* ============================================
            UTILITIES
            ============================================ */
@@ -1475,75 +2158,164 @@ class PharmReportTemplate:
                 gap: 24px;
             }
         }
-        """
+        """),
+)
+
+_REPORT_CSS = "".join(css for _, css in _CSS_BLOCKS)
+_CSS_BLOCK_NAMES = frozenset(name for name, _ in _CSS_BLOCKS)
+
+
+# PHARMASSIST_DEBUG_CSS=1 keeps comments and indentation in the emitted
+# stylesheet so it can be read in browser dev tools
+_CSS_DEBUG = os.environ.get("PHARMASSIST_DEBUG_CSS") == "1"
+
+
+@functools.lru_cache(maxsize=None)
+def _build_css(include: frozenset, medium: Optional[str] = None) -> str:
+    """Resolve theme tokens in and minify the selected blocks, plus base, optionally for one media type"""
+    css = "".join(block for name, block in _CSS_BLOCKS if name == "base" or name in include)
+    if medium is not None:
+        css = _apply_media_type(css, medium)
+    if medium == "print":
+        css = _strip_interactive_rules(css)
+    css = _resolve_theme_tokens(css)
+    return css if _CSS_DEBUG else _minify_css(css)
+
+
+# Shared by every template instance
+_CSS = _build_css(_CSS_BLOCK_NAMES)
+
+_INLINE_STYLES_HTML = f"""<style>
+        {_CSS}
+    </style>"""
+
+# Print-only stylesheet for PDF output (see _apply_media_type)
+_CSS_PRINT = _build_css(_CSS_BLOCK_NAMES, "print")
+
+_INLINE_PRINT_STYLES_HTML = f"""<style>
+        {_CSS_PRINT}
+    </style>"""
+
+# Skeleton fields whose markup never varies for inline-CSS output
+_CONSTANT_FIELD_BYTES = {
+    "fonts": _FONTS_HTML.encode("utf-8"),
+    "styles": _INLINE_STYLES_HTML.encode("utf-8"),
+    "page_break": _PAGE_BREAK_HTML.encode("utf-8"),
+}
+_PDF_CONSTANT_FIELD_BYTES = {**_CONSTANT_FIELD_BYTES, "styles": _INLINE_PRINT_STYLES_HTML.encode("utf-8")}
+
+
+# ============================================
+# PALETTES
+# ============================================
+# Read-only module constants: renderers bind them to locals instead of
+# going through self.<attr> lookups per row/slice.
+
+# Color scheme matching frontend
+_REPORT_COLORS: Mapping[str, str] = MappingProxyType({
+    "primary": "#1e40af",
+    "primary_light": "#3b82f6",
+    "secondary": "#7c3aed",
+    "secondary_light": "#a78bfa",
+    "iqvia": "#3b82f6",         # blue
+    "clinical": "#10b981",      # emerald
+    "patent": "#f59e0b",        # amber
+    "exim": "#14b8a6",          # teal
+    "internal": "#ec4899",      # pink
+    "web": "#06b6d4",           # cyan
+    "report": "#8b5cf6",        # violet
+    "success": "#10b981",
+    "warning": "#f59e0b",
+    "danger": "#ef4444",
+    "neutral": "#6b7280",
+    "background": "#0f172a",
+    "card": "#1e293b",
+    "border": "#334155",
+    "text": "#f8fafc",
+    "text_muted": "#94a3b8",
+})
+
+# Chart colors matching frontend palette, cycled over the slices of a chart
+_CHART_COLORS = (
+    "#003f5c", "#2f4b7c", "#665191", "#a05195",
+    "#d45087", "#f95d6a", "#ff7c43", "#ffa600",
+)
+
+
+class PharmReportTemplate:
+    """
+    HTML Template Generator for Pharmaceutical Intelligence Reports.
     
-    def _render_cover_page(self, drug_name: str, indication: str, report_date: str) -> str:
-        """Render the cover page HTML - Editorial luxury design"""
-        return f"""
-        <div class="cover-page">
-            <div class="cover-header">
-                <div class="cover-logo">PharmAssist Intelligence</div>
-                <h1 class="cover-title">Pharmaceutical<br/>Intelligence Report</h1>
-                <p class="cover-subtitle">Comprehensive Drug Repurposing & Market Analysis</p>
-            </div>
-            
-            <div class="cover-content">
-                <div class="cover-drug-box">{drug_name.upper()}</div>
-                <p class="cover-indication">▸ {indication.upper() if indication and indication.lower() != 'general' else 'COMPREHENSIVE ANALYSIS'}</p>
-            </div>
-            
-            <div class="cover-footer">
-                <div class="cover-info-box">
-                    <p class="cover-info-item"><strong>Report Date:</strong> {report_date}</p>
-                    <p class="cover-info-item"><strong>Generated by:</strong> PharmAssist Multi-Agent System</p>
-                    <p class="cover-info-item" style="margin-top: 12px; font-size: 11px; opacity: 0.7;">Confidential — For Internal Use Only</p>
-                </div>
-            </div>
-        </div>
-        
-        <div class="page-break"></div>
-        """
+    Produces professional pharmaceutical reports with:
+    - Cover page with drug/indication branding
+    - Executive summary with key metrics
+    - All 6 agent data sections
+    - Strategic recommendations
+    - Print-ready PDF styling
+    """
+    
+    # Color scheme matching frontend
+    COLORS = _REPORT_COLORS
+    
+    # Chart colors matching frontend palette
+    CHART_COLORS = _CHART_COLORS
     
+    # Stylesheet shared by every instance
+    css = _CSS
+    # Pre-encoded for byte-oriented writers (responses, files)
+    css_bytes = _CSS.encode("utf-8")
+    css_hash = hashlib.sha256(css_bytes).hexdigest()[:12]
+    critical_css, deferred_css = _split_critical_css(_CSS)
+    deferred_css_bytes = deferred_css.encode("utf-8")
+    # Content-addressed file name for serving the CSS as an external stylesheet
+    stylesheet_filename = f"report.{css_hash}.css"
+    
+    @staticmethod
+    def _generate_css() -> str:
+        """Generate comprehensive CSS for the report - Production-grade aesthetic"""
+        return _REPORT_CSS
+    
+    @classmethod
+    def generate_css(cls, include: Optional[Iterable[str]] = None) -> str:
+        """Minified stylesheet limited to the named _CSS_BLOCKS (all of them by default)"""
+        if include is None:
+            return cls.css
+        include = frozenset(include)
+        unknown = include - _CSS_BLOCK_NAMES
+        if unknown:
+            raise ValueError(f"Unknown CSS blocks: {', '.join(sorted(unknown))}")
+        return _build_css(include)
+    
+    @_cached_render()
+    def _render_cover_page(self, drug_name: str, indication: str, report_date: str) -> str:
+        """Render the cover page HTML - Editorial luxury design"""
+        indication_display = indication.upper() if indication and indication.lower() != 'general' else 'COMPREHENSIVE ANALYSIS'
+        return _COVER_TEMPLATE.substitute(
+            drug_name=escape(drug_name.upper()),
+            indication_display=escape(indication_display),
+            report_date=escape(report_date),
+        )
+    
+    @_cached_render(lambda data: (data.get("opportunity_score", 0), data.get("key_takeaways", []), data.get("recommendation", "")))
     def _render_executive_summary(self, data: Dict) -> str:
         """Render executive summary section - Hero styling"""
         score = data.get("opportunity_score", 0)
-        score_class = "high" if score >= 75 else "medium" if score >= 50 else "low"
+        band = bisect.bisect_right(_SCORE_BREAKS, score)
         
         takeaways = data.get("key_takeaways", [])
         recommendation = data.get("recommendation", "")
-        rec_class = "strong" if score >= 75 else "moderate" if score >= 50 else "limited"
         
-        takeaways_html = "\n".join([f'<li>{t}</li>' for t in takeaways]) if takeaways else '<li>Analysis in progress...</li>'
+        takeaways_html = "\n".join(map(_TAKEAWAY_HTML, map(escape, takeaways))) if takeaways else '<li>Analysis in progress...</li>'
         
-        return f"""
-        <div class="executive-summary">
-            <div class="section-header">
-                <div class="section-icon" style="background: linear-gradient(135deg, #7c3aed 0%, #6366f1 100%); color: white;">📊</div>
-                <div>
-                    <h2 class="section-title">Executive Summary</h2>
-                    <p class="section-subtitle">Key findings and strategic recommendation</p>
-                </div>
-            </div>
-            
-            <div class="opportunity-score-card">
-                <p class="opportunity-score-label">Overall Opportunity Score</p>
-                <div class="opportunity-score-value {score_class}">{score:.0f}<span class="opportunity-score-max">/100</span></div>
-            </div>
-            
-            <div class="key-takeaways">
-                <h3>🎯 Key Takeaways</h3>
-                <ul>
-                    {takeaways_html}
-                </ul>
-            </div>
-            
-            <div class="recommendation-card {rec_class}">
-                <p class="recommendation-label">▸ Strategic Recommendation</p>
-                <p class="recommendation-text">{recommendation or 'Analysis in progress...'}</p>
-            </div>
-        </div>
-        """
+        return _EXECUTIVE_SUMMARY_TEMPLATE.substitute(
+            score_class=_SCORE_CLASSES[band],
+            score=f"{score:.0f}",
+            takeaways_html=takeaways_html,
+            rec_class=_REC_CLASSES[band],
+            recommendation=escape(recommendation) if recommendation else 'Analysis in progress...',
+        )
     
+    @_cached_render(lambda data: data.get("iqvia", {}))
     def _render_iqvia_section(self, data: Dict) -> str:
         """Render IQVIA Market Intelligence section - handles actual agent data"""
         iqvia = data.get("iqvia", {})
@@ -1551,52 +2323,45 @@ class PharmReportTemplate:
             return ""
         
         actual_data = iqvia.get("data", iqvia)
+        get = actual_data.get
+        summary = get("summary", {})
+        market_leader = get("marketLeader", {})
+        market_forecast = get("market_forecast", {})
+        top_therapies = get("topTherapies", [])
+        top_articles = get("topArticles", [])
         
         # Summary banner
-        summary = actual_data.get("summary", {})
         summary_html = ""
         if summary:
             answer = summary.get("answer", "")
-            answer_class = "positive" if "Yes" in answer or "High" in answer else "neutral" if "Stable" in answer else "negative"
+            answer_class = _iqvia_answer_class(answer)
+            question = summary.get('researcherQuestion', 'Is this worth exploring commercially?')
             explainers = summary.get("explainers", [])
-            explainers_html = " ".join([f'<span class="summary-explainer">{e}</span>' for e in explainers])
-            
-            summary_html = f"""
-            <div class="summary-banner iqvia">
-                <p class="summary-question">{summary.get('researcherQuestion', 'Is this worth exploring commercially?')}</p>
-                <p class="summary-answer {answer_class}">{answer}</p>
-                <div class="summary-explainers">{explainers_html}</div>
-            </div>
-            """
+            summary_html = _summary_banner("iqvia", question, answer_class, answer, explainers)
         
         # Metrics
         metrics_html = ""
-        market_size = actual_data.get("marketSizeUSD")
-        cagr = actual_data.get("cagrPercent")
-        total_growth = actual_data.get("totalGrowthPercent")
-        start_market = actual_data.get("startMarketSize")
-        market_leader = actual_data.get("marketLeader", {})
-        
         metrics = []
-        if market_size:
-            metrics.append(f'<div class="metric-card"><p class="metric-label">Market Size (2027)</p><p class="metric-value">${market_size:.1f}<span class="metric-unit">B</span></p></div>')
-        if start_market:
-            metrics.append(f'<div class="metric-card"><p class="metric-label">Current Market</p><p class="metric-value">${start_market:.1f}<span class="metric-unit">B</span></p></div>')
-        if cagr:
-            trend = "up" if cagr > 5 else "neutral"
-            metrics.append(f'<div class="metric-card"><p class="metric-label">CAGR</p><p class="metric-value">{cagr:.1f}<span class="metric-unit">%</span></p><p class="metric-trend {trend}">{"↑" if trend == "up" else "→"} Growth</p></div>')
-        if total_growth:
-            metrics.append(f'<div class="metric-card"><p class="metric-label">Total Growth</p><p class="metric-value">{total_growth:.1f}<span class="metric-unit">%</span></p></div>')
+        metric_card = _METRIC_CARD_HTML.format_map
+        for label, key, prefix, unit, with_trend in _IQVIA_METRIC_SPECS:
+            value = get(key)
+            if not value:
+                continue
+            trend_html = ""
+            if with_trend:
+                trend_html = _TREND_HTML[bisect.bisect_left(_TREND_BREAKS, value)]
+            metrics.append(metric_card({
+                "label": label, "value": prefix + format(value, ".1f"), "unit": unit, "trend": trend_html,
+            }))
         if market_leader:
             leader_name = market_leader.get("therapy", "N/A")
-            leader_share = market_leader.get("share", market_leader.get("shareValue", ""))
-            metrics.append(f'<div class="metric-card"><p class="metric-label">Market Leader</p><p class="metric-value" style="font-size: 18px;">{leader_name}</p><p class="metric-trend neutral">{leader_share}</p></div>')
+            leader_share = _first(market_leader, "share", "shareValue")
+            metrics.append(_LEADER_CARD_HTML % (escape(str(leader_name)), escape(str(leader_share))))
         
         if metrics:
             metrics_html = f'<div class="metrics-grid">{"".join(metrics)}</div>'
         
         # Market forecast chart from data
-        market_forecast = actual_data.get("market_forecast", {})
         forecast_html = ""
         if market_forecast and market_forecast.get("data"):
             forecast_data = market_forecast["data"]
@@ -1605,11 +2370,10 @@ class PharmReportTemplate:
                 data=forecast_data,
                 x_field="year",
                 y_field="value",
-                color=self.COLORS["iqvia"]
+                color=_REPORT_COLORS["iqvia"]
             )
         
         # Competitive share chart from topTherapies (actual agent data)
-        top_therapies = actual_data.get("topTherapies", [])
         competitive_html = ""
         if top_therapies:
             # Convert topTherapies to competitive share format
@@ -1622,7 +2386,7 @@ class PharmReportTemplate:
             )
         else:
             # Fallback to old format
-            competitive_share = actual_data.get("competitive_share", {})
+            competitive_share = get("competitive_share", {})
             if competitive_share and competitive_share.get("data"):
                 competitive_html = self._render_pie_chart(
                     title=competitive_share.get("title", "Competitive Landscape"),
@@ -1632,48 +2396,27 @@ class PharmReportTemplate:
                 )
         
         # Top articles section
-        top_articles = actual_data.get("topArticles", [])
         articles_html = ""
         if top_articles:
-            items = ""
-            for article in top_articles[:3]:  # Top 3 articles
-                title = article.get("title", "")
-                source = article.get("source", "")
-                snippet = article.get("snippet", "")
-                items += f'''
-                <div style="padding: 12px; background: rgba(93, 99, 255, 0.05); border: 1px solid rgba(93, 99, 255, 0.2); border-radius: 8px; margin-bottom: 8px;">
-                    <p style="font-size: 13px; font-weight: 500; color: var(--text); margin-bottom: 4px;">{title}</p>
-                    <p style="font-size: 11px; color: var(--text-muted);">
-                        <span style="color: var(--iqvia);">{source}</span>
-                    </p>
-                    {f'<p style="font-size: 12px; color: var(--text-muted); margin-top: 6px;">{snippet[:100]}...</p>' if snippet else ''}
-                </div>
-                '''
-            articles_html = f'''
-            <div class="chart-container" style="margin-top: 16px;">
-                <p class="chart-title">Market Research & Reports</p>
-                {items}
-            </div>
-            '''
-        
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <div class="section-icon iqvia">📈</div>
-                <div>
-                    <h2 class="section-title">Market Intelligence</h2>
-                    <p class="section-subtitle">IQVIA Insights — Market size, growth & competitive analysis</p>
-                </div>
-            </div>
-            
-            {summary_html}
-            {metrics_html}
-            {forecast_html}
-            {competitive_html}
-            {articles_html}
-        </div>
-        """
+            items = "".join(
+                _IQVIA_ARTICLE_HTML % (
+                    escape(article.get("title", "")),
+                    escape(article.get("source", "")),
+                    _NEWS_SNIPPET_HTML % escape(snippet[:100]) if (snippet := article.get("snippet", "")) else "",
+                )
+                for article in top_articles[:3]  # Top 3 articles
+            )
+            articles_html = _IQVIA_ARTICLES_TEMPLATE.substitute(items=items)
+        
+        return _IQVIA_SECTION_TEMPLATE.substitute(
+            summary_html=summary_html,
+            metrics_html=metrics_html,
+            forecast_html=forecast_html,
+            competitive_html=competitive_html,
+            articles_html=articles_html,
+        )
     
+    @_cached_render(lambda data: data.get("clinical", {}))
     def _render_clinical_section(self, data: Dict) -> str:
         """Render Clinical Trials section - handles actual agent data structure"""
         clinical = data.get("clinical", {})
@@ -1681,160 +2424,100 @@ class PharmReportTemplate:
             return ""
         
         actual_data = clinical.get("data", clinical)
+        get = actual_data.get
         
         # Build overview from summary if available
-        summary = actual_data.get("summary", {})
+        summary = get("summary", {})
         overview_html = ""
         if summary:
             answer = summary.get("answer", "Unknown")
             explainers = summary.get("explainers", [])
-            explainers_html = " ".join([f'<span class="summary-explainer">{e}</span>' for e in explainers])
-            
-            overview_html = f"""
-            <div class="summary-banner clinical">
-                <p class="summary-question">{summary.get('researcherQuestion', 'Is there clinical evidence?')}</p>
-                <p class="summary-answer neutral">{answer}</p>
-                <div class="summary-explainers">{explainers_html}</div>
-            </div>
-            """
+            overview_html = _summary_banner("clinical", summary.get("researcherQuestion", "Is there clinical evidence?"), "neutral", answer, explainers)
         
         # Build phase distribution from analysis data
-        analysis = actual_data.get("analysis", {})
+        analysis = get("analysis", {})
         phase_html = ""
         if analysis and analysis.get("phase_distribution"):
             phase_dist = analysis["phase_distribution"]
             total_trials = analysis.get("total_trials", 0)
             
-            metrics = []
-            for phase, count in phase_dist.items():
-                color = "green" if "3" in phase or "4" in phase else "blue"
-                metrics.append(f'''
-                <div class="metric-card">
-                    <p class="metric-label">{phase}</p>
-                    <p class="metric-value">~{count}<span class="metric-unit">trials</span></p>
-                    <p class="metric-trend neutral"><span class="status-dot {color}"></span>Active</p>
-                </div>
-                ''')
-            phase_html = f'''
-            <div class="chart-container">
-                <p class="chart-title">Clinical Trial Phase Distribution</p>
-                <div class="metrics-grid">{"".join(metrics)}</div>
-                <p style="color: var(--text-muted); font-size: 13px; margin-top: 16px;">Total trials analyzed: {total_trials}</p>
-            </div>
-            '''
+            cards = "".join(
+                _CLINICAL_PHASE_CARD_HTML % (
+                    escape(str(phase)), escape(str(count)), "green" if "3" in phase or "4" in phase else "blue",
+                )
+                for phase, count in phase_dist.items()
+            )
+            phase_html = _CLINICAL_PHASES_TEMPLATE.substitute(cards=cards, total_trials=escape(str(total_trials)))
         
         # Build sponsor info from trials data
-        trials_data = actual_data.get("trials", {})
+        trials_data = get("trials", {})
         sponsor_html = ""
         if isinstance(trials_data, dict) and trials_data.get("trials"):
             trials_list = trials_data["trials"]
             
-            # Extract and count sponsors
-            sponsors = {}
-            for trial in trials_list[:20]:  # First 20 trials
-                sponsor = trial.get("sponsor", trial.get("lead_sponsor", "Unknown"))
-                sponsors[sponsor] = sponsors.get(sponsor, 0) + 1
+            # Extract and count sponsors (first 20 trials)
+            sponsors = Counter(
+                _first(trial, "sponsor", "lead_sponsor", default="Unknown") for trial in trials_list[:20]
+            )
             
             if sponsors:
-                rows = ""
-                for sponsor, count in list(sorted(sponsors.items(), key=lambda x: -x[1]))[:5]:
-                    rows += f'''
-                    <tr>
-                        <td>{sponsor}</td>
-                        <td style="color: var(--clinical);">~{count}</td>
-                        <td>Clinical Research</td>
-                    </tr>
-                    '''
-                sponsor_html = f'''
-                <div class="data-table-container">
-                    <p class="data-table-title">Top Clinical Trial Sponsors</p>
-                    <table class="data-table">
-                        <thead>
-                            <tr>
-                                <th>Sponsor</th>
-                                <th>Trials</th>
-                                <th>Focus Area</th>
-                            </tr>
-                        </thead>
-                        <tbody>{rows}</tbody>
-                    </table>
-                </div>
-                '''
+                rows = "".join(
+                    _CLINICAL_SPONSOR_ROW_HTML % (escape(str(sponsor)), count)
+                    for sponsor, count in sponsors.most_common(5)
+                )
+                sponsor_html = _CLINICAL_SPONSORS_TEMPLATE.substitute(rows=rows)
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <div class="section-icon clinical">🧬</div>
-                <div>
-                    <h2 class="section-title">Clinical Landscape</h2>
-                    <p class="section-subtitle">Clinical Trials — Pipeline analysis & trial intelligence</p>
-                </div>
-            </div>
-            
-            {overview_html}
-            {phase_html}
-            {sponsor_html}
-        </div>
-        """
+        return _CLINICAL_SECTION_TEMPLATE.substitute(
+            overview_html=overview_html,
+            phase_html=phase_html,
+            sponsor_html=sponsor_html,
+        )
     
+    @_cached_render(lambda data: data.get("patent", {}))
     def _render_patent_section(self, data: Dict) -> str:
         """Render Patent Landscape section - handles actual agent data structure"""
         patent = data.get("patent", {})
         if not patent:
             return ""
         
-        actual_data = patent.get("data", patent)
+        view = _PatentView.from_section(patent)
+        fto_status = view.fto_status
+        patents_found = view.patents_found
+        risk_level = view.risk_level
+        blocking_count = view.blocking_count
         
         # Build summary banner from actual patent data
-        fto_status = actual_data.get("ftoStatus", "UNKNOWN")
-        patents_found = actual_data.get("patentsFound", 0)
-        risk_level = actual_data.get("normalizedRiskInternal", 0)
-        
-        answer_class = "positive" if fto_status == "CLEAR" else "neutral" if fto_status == "AT_RISK" else "negative"
+        answer_class = _FTO_STATUS_CLASS.get(fto_status, "negative")
         
         # Build explainers
-        explainers = []
-        explainers.append(f"Patents found: {patents_found}")
-        explainers.append(f"Risk level: {risk_level}")
-        blocking_summary = actual_data.get("blockingPatentsSummary", {})
-        if blocking_summary.get("count", 0) > 0:
-            explainers.append(f"Blocking patents: {blocking_summary['count']}")
-        
-        explainers_html = " ".join([f'<span class="summary-explainer">{e}</span>' for e in explainers])
-        
-        summary_html = f"""
-        <div class="summary-banner patent">
-            <p class="summary-question">Is there Freedom to Operate (FTO)?</p>
-            <p class="summary-answer {answer_class}">{fto_status}</p>
-            <div class="summary-explainers">{explainers_html}</div>
-        </div>
-        """
-        
-        # Build overview metrics
-        metrics = []
-        metrics.append(f'<div class="metric-card"><p class="metric-label">FTO Status</p><p class="metric-value" style="font-size: 16px;">{fto_status}</p></div>')
-        metrics.append(f'<div class="metric-card"><p class="metric-label">Patents Found</p><p class="metric-value" style="font-size: 16px;">{patents_found}</p></div>')
-        metrics.append(f'<div class="metric-card"><p class="metric-label">Risk Score</p><p class="metric-value" style="font-size: 16px;">{risk_level}/100</p></div>')
-        if blocking_summary:
-            metrics.append(f'<div class="metric-card"><p class="metric-label">Blocking Patents</p><p class="metric-value" style="font-size: 16px;">{blocking_summary.get("count", 0)}</p></div>')
-        
-        overview_html = f'<div class="metrics-grid">{"".join(metrics)}</div>'
+        explainers = [f"Patents found: {patents_found}", f"Risk level: {risk_level}"]
+        if blocking_count > 0:
+            explainers.append(f"Blocking patents: {blocking_count}")
+        
+        summary_html = _summary_banner("patent", "Is there Freedom to Operate (FTO)?", answer_class, fto_status, explainers)
+        
+        # Build overview metrics: three fixed cards, plus blocking patents when reported
+        cards = [
+            _metric_card("FTO Status", escape(str(fto_status)), style=_COMPACT_VALUE_STYLE),
+            _metric_card("Patents Found", escape(str(patents_found)), style=_COMPACT_VALUE_STYLE),
+            _metric_card("Risk Score", f"{escape(str(risk_level))}/100", style=_COMPACT_VALUE_STYLE),
+        ]
+        if view.has_blocking_summary:
+            cards.append(_metric_card("Blocking Patents", escape(str(blocking_count)), style=_COMPACT_VALUE_STYLE))
+        overview_html = f'<div class="metrics-grid">{"".join(cards)}</div>'
         
         # Recommended actions table
-        actions = actual_data.get("recommendedActions", [])
+        actions = view.actions
         actions_html = ""
         if actions:
-            rows = ""
+            rows = []
             for action in actions[:5]:
-                feasibility = action.get("feasibility", "MEDIUM")
-                feasibility_class = "positive" if feasibility == "HIGH" else "neutral" if feasibility == "MEDIUM" else "negative"
-                rows += f'''
-                <tr>
-                    <td>{action.get("action", "")}</td>
-                    <td>{action.get("reason", "")}</td>
-                    <td class="{feasibility_class}">{feasibility}</td>
-                </tr>
-                '''
+                action_text, reason, feasibility = _PATENT_ACTION_FIELDS(_PATENT_ACTION_DEFAULTS | action)
+                feasibility_class = _FEASIBILITY_CLASS.get(feasibility, "negative")
+                rows.append(_PATENT_ACTION_ROW_HTML % (
+                    escape(str(action_text)), escape(str(reason)),
+                    feasibility_class, escape(str(feasibility)),
+                ))
             actions_html = f'''
             <div class="data-table-container">
                 <p class="data-table-title">Recommended Patent Strategy Actions</p>
@@ -1846,43 +2529,32 @@ class PharmReportTemplate:
                             <th>Feasibility</th>
                         </tr>
                     </thead>
-                    <tbody>{rows}</tbody>
+                    <tbody>{"".join(rows)}</tbody>
                 </table>
             </div>
             '''
         
         # Summary layers from patent analysis
-        summary_layers = actual_data.get("summaryLayers", {})
+        executive = view.executive
+        business = view.business
         layers_html = ""
-        if summary_layers:
-            executive = summary_layers.get("executive", "")
-            business = summary_layers.get("business", "")
-            if executive or business:
-                layers_html = f'''
-                <div class="summary-banner patent" style="margin-top: 16px;">
+        if executive or business:
+            layers_html = f'''
+                <div class="summary-banner" style="{_AGENT_TONE_STYLE['patent']} margin-top: 16px;">
                     <p class="summary-question">Patent Analysis Summary</p>
-                    <p style="color: var(--text-muted); font-size: 13px; margin-top: 8px;">{executive}</p>
-                    {f'<p style="color: var(--text-secondary); font-size: 12px; margin-top: 8px;">{business}</p>' if business else ""}
+                    <p style="color: var(--text-muted); font-size: 13px; margin-top: 8px;">{escape(str(executive))}</p>
+                    {f'<p style="color: var(--text-secondary); font-size: 12px; margin-top: 8px;">{escape(str(business))}</p>' if business else ""}
                 </div>
                 '''
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <div class="section-icon patent">🛡️</div>
-                <div>
-                    <h2 class="section-title">IP & Patent Analysis</h2>
-                    <p class="section-subtitle">Patent Landscape — FTO assessment & IP strategy</p>
-                </div>
-            </div>
-            
-            {summary_html}
-            {overview_html}
-            {actions_html}
-            {layers_html}
-        </div>
-        """
+        return _section_html(_PATENT_SECTION_HEAD, (
+            summary_html,
+            overview_html,
+            actions_html,
+            layers_html,
+        ))
     
+    @_cached_render(lambda data: data.get("exim", {}))
     def _render_exim_section(self, data: Dict) -> str:
         """Render EXIM Trade section - handles actual agent data structure"""
         exim = data.get("exim", {})
@@ -1890,46 +2562,31 @@ class PharmReportTemplate:
             return ""
         
         actual_data = exim.get("data", exim)
+        get = actual_data.get
         
         # Summary banner from actual agent data
-        summary = actual_data.get("summary", {})
+        summary = get("summary", {})
         summary_html = ""
         if summary:
             answer = summary.get("answer", "Stable")
-            answer_class = "positive" if answer in ["Yes", "Active"] else "neutral" if answer == "Stable" else "negative"
+            answer_class = _EXIM_ANSWER_CLASS.get(answer, "negative")
             explainers = summary.get("explainers", [])
-            explainers_html = " ".join([f'<span class="summary-explainer">{e}</span>' for e in explainers])
-            
-            summary_html = f"""
-            <div class="summary-banner exim">
-                <p class="summary-question">{summary.get('researcherQuestion', 'Is there active export trade?')}</p>
-                <p class="summary-answer {answer_class}">{answer}</p>
-                <div class="summary-explainers">{explainers_html}</div>
-            </div>
-            """
+            summary_html = _summary_banner("exim", summary.get("researcherQuestion", "Is there active export trade?"), answer_class, answer, explainers)
         
         # Trade volume table from actual trade_data
-        trade_data = actual_data.get("trade_data", {})
+        trade_data = get("trade_data", {})
         trade_html = ""
         if trade_data and trade_data.get("rows"):
-            rows_html = ""
+            rows_html = []
             for row in trade_data["rows"][:10]:  # Top 10 countries
-                country = row.get("Country", "Unknown")
-                current_val = row.get("2024 - 2025", "N/A")
-                previous_val = row.get("2023 - 2024", "N/A")
-                share = row.get("%Share", "N/A")
-                growth = row.get("%Growth", "0")
+                country, current_val, previous_val, share, growth = _TRADE_ROW_FIELDS(_TRADE_ROW_DEFAULTS | row)
                 
-                growth_color = "var(--success)" if float(growth or 0) > 0 else "var(--danger)" if float(growth or 0) < 0 else "var(--text-muted)"
-                rows_html += f'''
-                <tr>
-                    <td>{country}</td>
-                    <td>${current_val}M</td>
-                    <td>${previous_val}M</td>
-                    <td>{share}%</td>
-                    <td style="color: {growth_color}; font-weight: 600;">{growth}%</td>
-                </tr>
-                '''
+                growth_value = float(growth or 0)
+                growth_color = _GROWTH_COLORS[(growth_value > 0) - (growth_value < 0) + 1]
+                rows_html.append(_TRADE_ROW_HTML % (
+                    escape(str(country)), escape(str(current_val)), escape(str(previous_val)),
+                    escape(str(share)), growth_color, escape(str(growth)),
+                ))
             trade_html = f'''
             <div class="data-table-container">
                 <p class="data-table-title">Export Trade Volume by Country</p>
@@ -1943,13 +2600,13 @@ class PharmReportTemplate:
                             <th>Growth</th>
                         </tr>
                     </thead>
-                    <tbody>{rows_html}</tbody>
+                    <tbody>{"".join(rows_html)}</tbody>
                 </table>
             </div>
             '''
         
         # Analysis summary from actual data
-        analysis = actual_data.get("analysis", {})
+        analysis = get("analysis", {})
         analysis_html = ""
         if analysis and analysis.get("summary"):
             summary_data = analysis["summary"]
@@ -1957,43 +2614,35 @@ class PharmReportTemplate:
             growth = summary_data.get("overall_growth", 0)
             top_partner = summary_data.get("top_partner", "N/A")
             
-            metrics = []
-            metrics.append(f'''<div class="metric-card"><p class="metric-label">Total Trade Value</p><p class="metric-value">${total_val:,.1f}<span class="metric-unit">M</span></p></div>''')
-            metrics.append(f'''<div class="metric-card"><p class="metric-label">YoY Growth</p><p class="metric-value">{growth:+.1f}<span class="metric-unit">%</span></p></div>''')
-            metrics.append(f'''<div class="metric-card"><p class="metric-label">Top Partner</p><p class="metric-value" style="font-size: 16px;">{top_partner}</p></div>''')
+            metrics = (
+                _metric_card("Total Trade Value", f"${total_val:,.1f}", unit="M"),
+                _metric_card("YoY Growth", f"{growth:+.1f}", unit="%"),
+                _metric_card("Top Partner", escape(str(top_partner)), style=_COMPACT_VALUE_STYLE),
+            )
             
             analysis_html = f'<div class="metrics-grid">{"".join(metrics)}</div>'
         
         # LLM insights if available
-        insights = actual_data.get("llm_insights", {})
+        insights = get("llm_insights", {})
         insights_html = ""
         if insights:
             desc = insights.get("trade_volume_description", "")
             if desc:
                 insights_html = f'''
-                <div class="summary-banner exim" style="margin-top: 16px;">
+                <div class="summary-banner" style="{_AGENT_TONE_STYLE['exim']} margin-top: 16px;">
                     <p class="summary-question">Trade Intelligence Insights</p>
-                    <p style="color: var(--text-muted); font-size: 13px; margin-top: 8px;">{desc[:500]}...</p>
+                    <p style="color: var(--text-muted); font-size: 13px; margin-top: 8px;">{escape(desc[:500])}...</p>
                 </div>
                 '''
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <div class="section-icon exim">🌍</div>
-                <div>
-                    <h2 class="section-title">Trade & Supply Chain</h2>
-                    <p class="section-subtitle">EXIM Analysis — Export-import trends & sourcing intelligence</p>
-                </div>
-            </div>
-            
-            {summary_html}
-            {analysis_html}
-            {trade_html}
-            {insights_html}
-        </div>
-        """
+        return _section_html(_EXIM_SECTION_HEAD, (
+            summary_html,
+            analysis_html,
+            trade_html,
+            insights_html,
+        ))
     
+    @_cached_render(lambda data: data.get("internal_knowledge", {}))
     def _render_internal_section(self, data: Dict) -> str:
         """Render Internal Knowledge section - handles actual agent data structure"""
         internal = data.get("internal_knowledge", {})
@@ -2001,27 +2650,20 @@ class PharmReportTemplate:
             return ""
         
         actual_data = internal.get("data", internal)
+        get = actual_data.get
         
         # Summary banner from actual agent data
-        summary = actual_data.get("summary", {})
+        summary = get("summary", {})
         summary_html = ""
         if summary and summary.get("researcherQuestion"):
             answer = summary.get("answer", "Yes")
-            answer_class = "positive" if answer in ["Yes", "Strong"] else "neutral"
+            answer_class = _INTERNAL_ANSWER_CLASS.get(answer, "neutral")
             explainers = summary.get("explainers", [])
-            explainers_html = " ".join([f'<span class="summary-explainer">{e}</span>' for e in explainers])
-            
-            summary_html = f"""
-            <div class="summary-banner internal">
-                <p class="summary-question">{summary.get('researcherQuestion', 'Does internal knowledge support this research?')}</p>
-                <p class="summary-answer {answer_class}">{answer}</p>
-                <div class="summary-explainers">{explainers_html}</div>
-            </div>
-            """
+            summary_html = _summary_banner("internal", summary.get("researcherQuestion", "Does internal knowledge support this research?"), answer_class, answer, explainers)
         
         # Overview section
-        overview = actual_data.get("overview", "")
-        analysis = actual_data.get("analysis", {})
+        overview = get("overview", "")
+        analysis = get("analysis", {})
         if not overview and analysis:
             overview = analysis.get("overview", "")
         
@@ -2030,51 +2672,45 @@ class PharmReportTemplate:
             overview_html = f"""
             <div class="chart-container">
                 <p class="chart-title">Strategic Overview</p>
-                <p style="font-size: 13px; color: var(--text); line-height: 1.6;">{overview[:800]}{"..." if len(overview) > 800 else ""}</p>
+                <p style="font-size: 13px; color: var(--text); line-height: 1.6;">{escape(_ellipsize(overview, 800))}</p>
             </div>
             """
         
         # Key findings
-        key_findings = actual_data.get("key_findings", [])
+        key_findings = get("key_findings", [])
         if not key_findings and analysis:
             key_findings = analysis.get("key_findings", [])
         
         findings_html = ""
         if key_findings:
-            items = ""
+            items = []
             for i, finding in enumerate(key_findings[:5], 1):  # Top 5 findings
-                items += f'''
-                <div class="metric-card" style="min-width: 100%; margin-bottom: 12px;">
-                    <p class="metric-label">Finding #{i}</p>
-                    <p style="font-size: 13px; color: var(--text); line-height: 1.5;">{finding[:300]}{"..." if len(finding) > 300 else ""}</p>
-                </div>
-                '''
+                items.append(_FINDING_CARD_HTML % (i, escape(_ellipsize(finding, 300))))
             findings_html = f'''
             <div class="chart-container">
                 <p class="chart-title">Key Findings from Internal Analysis</p>
-                <div style="display: flex; flex-direction: column;">{items}</div>
+                <div style="display: flex; flex-direction: column;">{"".join(items)}</div>
             </div>
             '''
         
         # Recommendations
-        recommendations = actual_data.get("recommendations", [])
+        recommendations = get("recommendations", [])
         if not recommendations and analysis:
             recommendations = analysis.get("recommendations", [])
         
         recommendations_html = ""
         if recommendations:
-            items = ""
-            for rec in recommendations[:3]:  # Top 3 recommendations
-                items += f'<li style="margin-bottom: 8px; color: var(--text); font-size: 13px;">{rec}</li>'
+            # Top 3 recommendations
+            items = map(_RECOMMENDATION_ITEM_HTML, map(escape, map(str, recommendations[:3])))
             recommendations_html = f'''
-            <div class="summary-banner internal" style="margin-top: 16px;">
+            <div class="summary-banner" style="{_AGENT_TONE_STYLE['internal']} margin-top: 16px;">
                 <p class="summary-question">Strategic Recommendations</p>
-                <ul style="margin-top: 12px; padding-left: 20px;">{items}</ul>
+                <ul style="margin-top: 12px; padding-left: 20px;">{"".join(items)}</ul>
             </div>
             '''
         
         # Strategic implications
-        implications = actual_data.get("strategic_implications", "")
+        implications = get("strategic_implications", "")
         if not implications and analysis:
             implications = analysis.get("strategic_implications", "")
         
@@ -2083,46 +2719,35 @@ class PharmReportTemplate:
             implications_html = f'''
             <div class="chart-container" style="margin-top: 16px;">
                 <p class="chart-title">Strategic Implications</p>
-                <p style="font-size: 13px; color: var(--text); line-height: 1.6;">{implications[:600]}{"..." if len(implications) > 600 else ""}</p>
+                <p style="font-size: 13px; color: var(--text); line-height: 1.6;">{escape(_ellipsize(implications, 600))}</p>
             </div>
             '''
         
         # Internal references
-        references = actual_data.get("internal_references", [])
+        references = get("internal_references", [])
         if not references and analysis:
             references = analysis.get("internal_references", [])
         
         references_html = ""
         if references:
-            ref_items = ""
-            for ref in references[:4]:
-                ref_items += f'<span class="summary-explainer" style="display: inline-block; margin: 4px;">📄 {ref}</span>'
+            ref_items = map(_REFERENCE_CHIP_HTML, map(escape, map(str, references[:4])))
             references_html = f'''
             <div style="margin-top: 16px; padding: 12px; background: var(--section-bg); border-radius: 8px;">
                 <p style="font-size: 12px; color: var(--text-muted); margin-bottom: 8px;">Data Sources</p>
-                {ref_items}
+                {"".join(ref_items)}
             </div>
             '''
         
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <div class="section-icon internal">📚</div>
-                <div>
-                    <h2 class="section-title">Internal Knowledge</h2>
-                    <p class="section-subtitle">Company Intelligence — Prior research & strategic insights</p>
-                </div>
-            </div>
-            
-            {summary_html}
-            {overview_html}
-            {findings_html}
-            {implications_html}
-            {recommendations_html}
-            {references_html}
-        </div>
-        """
+        return _section_html(_INTERNAL_SECTION_HEAD, (
+            summary_html,
+            overview_html,
+            findings_html,
+            implications_html,
+            recommendations_html,
+            references_html,
+        ))
     
+    @_cached_render(lambda data: data.get("web_intelligence", {}))
     def _render_web_intel_section(self, data: Dict) -> str:
         """Render Web Intelligence section - handles actual agent data structure"""
         web = data.get("web_intelligence", {})
@@ -2130,26 +2755,19 @@ class PharmReportTemplate:
             return ""
         
         actual_data = web.get("data", web)
+        get = actual_data.get
         
         # Summary banner
-        summary = actual_data.get("summary", {})
+        summary = get("summary", {})
         summary_html = ""
         if summary and summary.get("researcherQuestion"):
             answer = summary.get("answer", "Neutral")
-            answer_class = "positive" if answer in ["Positive", "Favorable"] else "neutral" if answer in ["Neutral", "Mixed"] else "negative"
+            answer_class = _WEB_ANSWER_CLASS.get(answer, "negative")
             explainers = summary.get("explainers", [])
-            explainers_html = " ".join([f'<span class="summary-explainer">{e}</span>' for e in explainers])
-            
-            summary_html = f"""
-            <div class="summary-banner web">
-                <p class="summary-question">{summary.get('researcherQuestion', 'Is market sentiment favorable?')}</p>
-                <p class="summary-answer {answer_class}">{answer}</p>
-                <div class="summary-explainers">{explainers_html}</div>
-            </div>
-            """
+            summary_html = _summary_banner("web", summary.get("researcherQuestion", "Is market sentiment favorable?"), answer_class, answer, explainers)
         
         # Top signal from actual agent data
-        top_signal = actual_data.get("top_signal", {})
+        top_signal = get("top_signal", {})
         signal_html = ""
         if top_signal:
             score = top_signal.get("score", 0)
@@ -2158,275 +2776,130 @@ class PharmReportTemplate:
             why = top_signal.get("why", [])
             
             # Determine color based on label
-            label_class = "high" if label == "HIGH" else "medium" if label in ["MEDIUM", "MODERATE"] else "low"
+            label_class = _SIGNAL_LABEL_CLASS.get(label, "low")
             
             why_html = ""
             if why:
-                why_items = "".join([f'<li style="color: var(--text-muted); font-size: 12px; margin: 4px 0;">{w}</li>' for w in why[:4]])
+                why_items = "".join(map(_WHY_ITEM_HTML, map(escape, map(str, why[:4]))))
                 why_html = f'<ul style="margin-top: 8px; padding-left: 16px;">{why_items}</ul>'
             
             signal_html = f'''
             <div class="metrics-grid" style="margin-bottom: 16px;">
                 <div class="metric-card">
                     <p class="metric-label">Signal Score</p>
-                    <p class="metric-value">{score}<span class="metric-unit">/100</span></p>
+                    <p class="metric-value">{escape(str(score))}<span class="metric-unit">/100</span></p>
                 </div>
                 <div class="metric-card">
                     <p class="metric-label">Signal Strength</p>
-                    <p class="metric-value"><span class="badge {label_class}">{label}</span></p>
+                    <p class="metric-value"><span class="badge {label_class}">{escape(str(label))}</span></p>
                 </div>
             </div>
             <div class="chart-container">
                 <p class="chart-title">Intelligence Summary</p>
-                <p style="font-size: 13px; color: var(--text); white-space: pre-line;">{text[:500] if text else "No signal text available"}</p>
+                <p style="font-size: 13px; color: var(--text); white-space: pre-line;">{escape(text[:500]) if text else "No signal text available"}</p>
                 {why_html}
             </div>
             '''
         
         # Sentiment summary (parse from explainers if not directly available)
-        sentiment = actual_data.get("sentiment_summary", {})
+        sentiment = get("sentiment_summary", {})
         sentiment_html = ""
-        if sentiment and (sentiment.get("positive") or sentiment.get("neutral") or sentiment.get("negative")):
+        positive, neutral, negative = (
+            (sentiment.get("positive", 0), sentiment.get("neutral", 0), sentiment.get("negative", 0))
+            if sentiment else (0, 0, 0)
+        )
+        if positive or neutral or negative:
+            positive, neutral, negative = map(escape, map(str, (positive, neutral, negative)))
             sentiment_html = f'''
             <div class="metrics-grid">
                 <div class="metric-card">
                     <p class="metric-label">Positive</p>
-                    <p class="metric-value" style="color: var(--success);">{sentiment.get("positive", 0)}<span class="metric-unit">%</span></p>
+                    <p class="metric-value" style="color: var(--success);">{positive}<span class="metric-unit">%</span></p>
                 </div>
                 <div class="metric-card">
                     <p class="metric-label">Neutral</p>
-                    <p class="metric-value" style="color: var(--exim);">{sentiment.get("neutral", 0)}<span class="metric-unit">%</span></p>
+                    <p class="metric-value" style="color: var(--exim);">{neutral}<span class="metric-unit">%</span></p>
                 </div>
                 <div class="metric-card">
                     <p class="metric-label">Negative</p>
-                    <p class="metric-value" style="color: var(--warning);">{sentiment.get("negative", 0)}<span class="metric-unit">%</span></p>
+                    <p class="metric-value" style="color: var(--warning);">{negative}<span class="metric-unit">%</span></p>
                 </div>
             </div>
             '''
         
         # News articles from top_headlines or news_articles
-        news = actual_data.get("top_headlines") or actual_data.get("news_articles") or actual_data.get("news", [])
+        news = get("top_headlines") or get("news_articles") or get("news", [])
         news_html = ""
         if news:
-            items = ""
+            items = []
             for n in news[:4]:
-                title = n.get("title", "")
-                source = n.get("source", "")
-                published = n.get("publishedAt", "")
-                snippet = n.get("snippet", "")
-                tags = n.get("tags", [])
+                title, source, published, snippet, tags = _NEWS_ITEM_FIELDS(_NEWS_ITEM_DEFAULTS | n)
                 
                 tags_html = ""
                 if tags:
-                    tags_html = " ".join([f'<span class="summary-explainer" style="font-size: 10px;">{t}</span>' for t in tags[:3]])
+                    tags_html = " ".join(map(_NEWS_TAG_HTML, map(escape, map(str, tags[:3]))))
                 
-                items += f'''
-                <div style="padding: 12px; background: rgba(6, 182, 212, 0.05); border: 1px solid rgba(6, 182, 212, 0.2); border-radius: 8px; margin-bottom: 8px;">
-                    <p style="font-size: 13px; font-weight: 500; color: var(--text); margin-bottom: 4px;">{title}</p>
-                    <p style="font-size: 11px; color: var(--text-muted); margin-bottom: 6px;">
-                        <span style="color: var(--web);">{source}</span>
-                        {f' • {published[:10]}' if published else ""}
-                    </p>
-                    {f'<p style="font-size: 12px; color: var(--text-muted);">{snippet[:150]}...</p>' if snippet else ''}
-                    {tags_html}
-                </div>
-                '''
+                items.append(_NEWS_ITEM_HTML % (
+                    escape(str(title)),
+                    escape(str(source)),
+                    f' • {escape(published[:10])}' if published else "",
+                    _NEWS_SNIPPET_HTML % escape(snippet[:150]) if snippet else "",
+                    tags_html,
+                ))
             news_html = f'''
             <div class="chart-container">
                 <p class="chart-title">Recent News & Headlines ({len(news)} articles)</p>
-                {items}
+                {"".join(items)}
             </div>
             '''
         
         # Trend sparkline info if available
-        sparkline = actual_data.get("trend_sparkline", {})
+        sparkline = get("trend_sparkline", {})
         trend_html = ""
         if sparkline and sparkline.get("title"):
             desc = sparkline.get("description", "")
             trend_html = f'''
             <div style="margin-top: 16px; padding: 12px; background: var(--section-bg); border-radius: 8px;">
-                <p style="font-size: 14px; font-weight: 600; color: var(--text);">📈 {sparkline.get("title")}</p>
-                <p style="font-size: 12px; color: var(--text-muted);">{desc}</p>
+                <p style="font-size: 14px; font-weight: 600; color: var(--text);">📈 {escape(str(sparkline.get("title")))}</p>
+                <p style="font-size: 12px; color: var(--text-muted);">{escape(str(desc))}</p>
             </div>
             '''
         
         # Confidence
-        confidence = actual_data.get("confidence", "MEDIUM")
-        confidence_class = {"HIGH": "low", "MEDIUM": "medium", "LOW": "high"}.get(confidence, "medium")
-        
-        return f"""
-        <div class="section">
-            <div class="section-header">
-                <div class="section-icon web">🌐</div>
-                <div>
-                    <h2 class="section-title">External Intelligence</h2>
-                    <p class="section-subtitle">Web Intelligence — News, sentiment & market buzz</p>
-                </div>
-            </div>
-            
-            {summary_html}
-            {signal_html}
-            {sentiment_html}
-            {news_html}
-            {trend_html}
-            
-            <div style="text-align: right; margin-top: 16px;">
-                <span class="badge {confidence_class}">Confidence: {confidence}</span>
-            </div>
-        </div>
-        """
+        confidence = get("confidence", "MEDIUM")
+        confidence_class = _CONFIDENCE_CLASS.get(confidence, "medium")
+        
+        return _section_html(_WEB_INTEL_SECTION_HEAD, (
+            summary_html,
+            signal_html,
+            sentiment_html,
+            news_html,
+            trend_html,
+        ), _WEB_INTEL_SECTION_TAIL % (confidence_class, escape(str(confidence))))
+    
+    # Agent sections as (skeleton field, report data key, renderer). A section
+    # whose data is missing or empty is filled with "" directly, skipping the
+    # renderer call and its cache-key digest.
+    _AGENT_SECTIONS = (
+        ("iqvia", "iqvia", _render_iqvia_section),
+        ("clinical", "clinical", _render_clinical_section),
+        ("patent", "patent", _render_patent_section),
+        ("exim", "exim", _render_exim_section),
+        ("internal", "internal_knowledge", _render_internal_section),
+        ("web", "web_intelligence", _render_web_intel_section),
+    )
     
     def _render_bar_chart(self, title: str, data: List[Dict], x_field: str, y_field: str, color: str = "#3b82f6") -> str:
         """Render a simple SVG bar chart"""
-        if not data:
-            return ""
-        
-        # Calculate dimensions
-        width = 600
-        height = 300
-        margin = {"top": 20, "right": 30, "bottom": 60, "left": 60}
-        chart_width = width - margin["left"] - margin["right"]
-        chart_height = height - margin["top"] - margin["bottom"]
-        
-        # Get max value
-        max_val = max(d.get(y_field, 0) for d in data)
-        if max_val == 0:
-            max_val = 1
-        
-        # Bar width
-        bar_width = chart_width / len(data) * 0.7
-        bar_gap = chart_width / len(data) * 0.15
-        
-        bars = ""
-        labels = ""
-        values = ""
-        
-        for i, d in enumerate(data):
-            x = margin["left"] + i * (chart_width / len(data)) + bar_gap
-            val = d.get(y_field, 0)
-            bar_height = (val / max_val) * chart_height
-            y = margin["top"] + chart_height - bar_height
-            
-            # Gradient
-            bars += f'''
-            <rect x="{x}" y="{y}" width="{bar_width}" height="{bar_height}" 
-                  fill="{color}" rx="4" opacity="0.9"/>
-            '''
-            
-            # X-axis label
-            labels += f'''
-            <text x="{x + bar_width/2}" y="{height - 20}" 
-                  class="label" text-anchor="middle">{d.get(x_field, "")}</text>
-            '''
-            
-            # Value label
-            values += f'''
-            <text x="{x + bar_width/2}" y="{y - 5}" 
-                  class="value-label" text-anchor="middle">${val}B</text>
-            '''
-        
-        return f'''
-        <div class="chart-container">
-            <p class="chart-title">{title}</p>
-            <svg class="chart-svg" viewBox="0 0 {width} {height}">
-                <!-- Grid lines -->
-                <line x1="{margin["left"]}" y1="{margin["top"]}" 
-                      x2="{margin["left"]}" y2="{margin["top"] + chart_height}" 
-                      class="axis-line"/>
-                <line x1="{margin["left"]}" y1="{margin["top"] + chart_height}" 
-                      x2="{width - margin["right"]}" y2="{margin["top"] + chart_height}" 
-                      class="axis-line"/>
-                
-                {bars}
-                {labels}
-                {values}
-            </svg>
-        </div>
-        '''
+        return render_bar_chart(title, data, x_field, y_field, color)
     
     def _render_pie_chart(self, title: str, data: List[Dict], label_field: str, value_field: str) -> str:
         """Render a simple SVG donut chart"""
-        if not data:
-            return ""
-        
-        # Parse share values
-        def parse_share(share):
-            if isinstance(share, (int, float)):
-                return float(share)
-            return float(str(share).replace("%", "").replace("~", "").strip() or 0)
-        
-        parsed_data = [(d.get(label_field, ""), parse_share(d.get(value_field, 0))) for d in data]
-        total = sum(v for _, v in parsed_data)
-        if total == 0:
-            total = 1
-        
-        # SVG dimensions
-        cx, cy = 120, 120
-        outer_r = 100
-        inner_r = 60
-        
-        # Generate pie slices
-        slices = ""
-        legend_items = ""
-        start_angle = -90  # Start from top
-        
-        for i, (label, value) in enumerate(parsed_data):
-            pct = value / total
-            angle = pct * 360
-            
-            # Calculate arc
-            end_angle = start_angle + angle
-            large_arc = 1 if angle > 180 else 0
-            
-            # Convert to radians
-            import math
-            start_rad = math.radians(start_angle)
-            end_rad = math.radians(end_angle)
-            
-            # Outer arc points
-            x1 = cx + outer_r * math.cos(start_rad)
-            y1 = cy + outer_r * math.sin(start_rad)
-            x2 = cx + outer_r * math.cos(end_rad)
-            y2 = cy + outer_r * math.sin(end_rad)
-            
-            # Inner arc points
-            x3 = cx + inner_r * math.cos(end_rad)
-            y3 = cy + inner_r * math.sin(end_rad)
-            x4 = cx + inner_r * math.cos(start_rad)
-            y4 = cy + inner_r * math.sin(start_rad)
-            
-            color = self.CHART_COLORS[i % len(self.CHART_COLORS)]
-            
-            path = f"M {x1} {y1} A {outer_r} {outer_r} 0 {large_arc} 1 {x2} {y2} L {x3} {y3} A {inner_r} {inner_r} 0 {large_arc} 0 {x4} {y4} Z"
-            slices += f'<path d="{path}" fill="{color}" stroke="var(--card)" stroke-width="2"/>'
-            
-            legend_items += f'''
-            <div class="donut-legend-item">
-                <div class="donut-legend-color" style="background: {color};"></div>
-                <span class="donut-legend-label">{label}</span>
-                <span class="donut-legend-value">{value:.0f}%</span>
-            </div>
-            '''
-            
-            start_angle = end_angle
-        
-        return f'''
-        <div class="chart-container">
-            <p class="chart-title">{title}</p>
-            <div class="donut-chart-container">
-                <svg width="240" height="240" viewBox="0 0 240 240">
-                    {slices}
-                </svg>
-                <div class="donut-legend">
-                    {legend_items}
-                </div>
-            </div>
-        </div>
-        '''
+        return render_pie_chart(title, data, label_field, value_field, _CHART_COLORS)
     
     def _render_footer(self) -> str:
         """Render report footer"""
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = datetime.now().isoformat(sep=" ", timespec="seconds")
         return f"""
         <div class="report-footer">
             <p><strong>PharmAssist Intelligence Platform</strong></p>
@@ -2435,61 +2908,140 @@ class PharmReportTemplate:
         </div>
         """
     
-    def generate(self, data: Dict) -> str:
+    def iter_html(self, data: Dict, stylesheet_href: Optional[str] = None, for_pdf: bool = False) -> Iterator[str]:
         """
-        Generate complete HTML report from agent data.
+        Yield the complete HTML report in document order, one chunk per section.
+        
+        Lets callers stream the report to a response or file without holding
+        the whole document in memory.
         
         Args:
             data: Dictionary containing all agent data and metadata
+            stylesheet_href: URL of the served non-critical stylesheet (see
+                stylesheet_filename). Critical CSS is still inlined. If None
+                the full CSS is inlined, which PDF conversion requires.
+            for_pdf: Inline the print-only stylesheet instead; stylesheet_href
+                is ignored
             
-        Returns:
-            Complete HTML string for the report
+        Yields:
+            HTML fragments that concatenate to the full report
         """
-        drug_name = data.get("drug_name", data.get("drug", "Unknown Drug"))
-        indication = data.get("indication", data.get("disease", "Unknown Indication"))
-        report_date = data.get("report_date", datetime.now().strftime("%B %d, %Y"))
-        
-        # Build HTML
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Pharmaceutical Intelligence Report — {drug_name}</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;500;600;700;800&family=DM+Sans:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-    <style>
-        {self.css}
-    </style>
-</head>
-<body>
-    <div class="report-container">
-        {self._render_cover_page(drug_name, indication, report_date)}
-        {self._render_executive_summary(data)}
-        {self._render_iqvia_section(data)}
-        {self._render_clinical_section(data)}
+        fields = self._report_fields(data, stylesheet_href, for_pdf)
+        for literal, field in _REPORT_SKELETON_PARTS:
+            if literal:
+                yield literal
+            if field is not None:
+                yield fields[field]()
+    
+    def write_to(
+        self, data: Dict, stream: TextIO, stylesheet_href: Optional[str] = None, for_pdf: bool = False
+    ) -> None:
+        """
+        Write the HTML report to a text stream section by section.
         
-        <div class="page-break"></div>
+        Each chunk from iter_html() goes straight to the stream, so the full
+        document is never joined in memory. Use iter_bytes() for binary
+        streams and response bodies.
         
-        {self._render_patent_section(data)}
-        {self._render_exim_section(data)}
+        Args:
+            data: Dictionary containing all agent data and metadata
+            stream: Writable text file-like object, e.g. open(path, "w", encoding="utf-8")
+            stylesheet_href: Optional URL of the external stylesheet; inline CSS if None
+            for_pdf: Inline the print-only stylesheet for PDF conversion
+        """
+        stream.writelines(self.iter_html(data, stylesheet_href, for_pdf))
+    
+    def generate(self, data: Dict, stylesheet_href: Optional[str] = None, for_pdf: bool = False) -> str:
+        """
+        Generate complete HTML report from agent data.
         
-        <div class="page-break"></div>
+        Args:
+            data: Dictionary containing all agent data and metadata
+            stylesheet_href: Optional URL of the external stylesheet; inline CSS if None
+            for_pdf: Inline the print-only stylesheet for PDF conversion
+            
+        Returns:
+            Complete HTML string for the report
+        """
+        fields = self._report_fields(data, stylesheet_href, for_pdf)
+        return _REPORT_SKELETON.format_map({name: render() for name, render in fields.items()})
+    
+    def iter_bytes(self, data: Dict, stylesheet_href: Optional[str] = None, for_pdf: bool = False) -> Iterator[bytes]:
+        """
+        Yield the HTML report as UTF-8 chunks in document order.
         
-        {self._render_internal_section(data)}
-        {self._render_web_intel_section(data)}
+        The byte counterpart of iter_html() for response bodies and files:
+        skeleton markup is pre-encoded, and with inline CSS so are the fonts
+        and stylesheet, so only section output is encoded per call.
         
-        {self._render_footer()}
-    </div>
-</body>
-</html>
+        Args:
+            data: Dictionary containing all agent data and metadata
+            stylesheet_href: Optional URL of the external stylesheet; inline CSS if None
+            for_pdf: Inline the print-only stylesheet for PDF conversion
+            
+        Yields:
+            UTF-8 chunks that concatenate to generate(data, stylesheet_href, for_pdf).encode()
+        """
+        fields = self._report_fields(data, stylesheet_href, for_pdf)
+        if for_pdf:
+            constant = _PDF_CONSTANT_FIELD_BYTES
+        else:
+            constant = _CONSTANT_FIELD_BYTES if stylesheet_href is None else {}
+        for literal, field in _REPORT_SKELETON_BYTE_PARTS:
+            if literal:
+                yield literal
+            if field is not None:
+                encoded = constant.get(field)
+                yield encoded if encoded is not None else fields[field]().encode("utf-8")
+    
+    def generate_bytes(self, data: Dict, for_pdf: bool = False) -> bytes:
         """
+        Generate the complete HTML report (inline CSS) as UTF-8 bytes.
         
-        return html
+        Args:
+            data: Dictionary containing all agent data and metadata
+            for_pdf: Inline the print-only stylesheet for PDF conversion
+            
+        Returns:
+            UTF-8 encoded HTML, identical to generate(data, for_pdf=for_pdf).encode()
+        """
+        return b"".join(self.iter_bytes(data, for_pdf=for_pdf))
+    
+    def _report_fields(
+        self, data: Dict, stylesheet_href: Optional[str], for_pdf: bool = False
+    ) -> Dict[str, Callable[[], str]]:
+        """Map each _REPORT_SKELETON field to a zero-argument renderer"""
+        drug_name = _first(data, "drug_name", "drug", default="Unknown Drug")
+        indication = _first(data, "indication", "disease", default="Unknown Indication")
+        report_date = data["report_date"] if "report_date" in data else datetime.now().strftime("%B %d, %Y")
+        
+        fields = {
+            "title": lambda: escape(drug_name),
+            "fonts": lambda: _FONTS_HTML,
+            "styles": (lambda: _INLINE_PRINT_STYLES_HTML) if for_pdf else (lambda: self._render_styles(stylesheet_href)),
+            "cover": lambda: self._render_cover_page(drug_name, indication, report_date),
+            "executive": lambda: self._render_executive_summary(data),
+            "page_break": lambda: _PAGE_BREAK_HTML,
+            "footer": self._render_footer,
+        }
+        for name, key, render in self._AGENT_SECTIONS:
+            fields[name] = functools.partial(render, self, data) if data.get(key) else str  # str() == ""
+        return fields
     
-    def generate_from_agents_data(self, agents_data: Dict, drug_name: str, indication: str) -> str:
+    def _render_styles(self, stylesheet_href: Optional[str]) -> str:
+        """Render the <head> style tags: full inline CSS, or critical CSS plus a preloaded stylesheet"""
+        if stylesheet_href:
+            href = escape(stylesheet_href)
+            return f"""<style>
+        {self.critical_css}
+    </style>
+    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="{href}"></noscript>"""
+        return _INLINE_STYLES_HTML
+    
+    def generate_from_agents_data(
+        self, agents_data: Dict, drug_name: str, indication: str, for_pdf: bool = False
+    ) -> str:
         """
         Generate report from raw agents data dictionary.
         
@@ -2497,17 +3049,11 @@ class PharmReportTemplate:
             agents_data: Dictionary with agent keys (iqvia, clinical, etc.)
             drug_name: Name of the drug
             indication: Target indication
+            for_pdf: Inline the print-only stylesheet for PDF conversion
             
         Returns:
             Complete HTML string
         """
-        from .report_schema import (
-            parse_agent_data_from_dict,
-            compute_opportunity_score,
-            generate_key_takeaways,
-            generate_recommendation
-        )
-        
         # Prepare data
         data = {
             "drug_name": drug_name,
@@ -2526,4 +3072,4 @@ class PharmReportTemplate:
         data["key_takeaways"] = takeaways
         data["recommendation"] = recommendation
         
-        return self.generate(data)
+        return self.generate(data, for_pdf=for_pdf)
@@ -7,8 +7,14 @@ Additional tools for enhanced report generation capabilities.
 from .pdf_converter import (
     convert_html_to_pdf,
     convert_html_to_pdf_async,
+    convert_html_to_pdf_stream,
+    convert_html_to_pdf_weasy,
     convert_html_file_to_pdf,
+    convert_many,
+    convert_many_async,
     convert_url_to_pdf,
+    close_browser,
+    close_sync_browser,
     PDF_PRESETS,
 )
 
@@ -21,8 +27,14 @@ except ImportError:
 __all__ = [
     "convert_html_to_pdf",
     "convert_html_to_pdf_async",
+    "convert_html_to_pdf_stream",
+    "convert_html_to_pdf_weasy",
     "convert_html_file_to_pdf",
+    "convert_many",
+    "convert_many_async",
     "convert_url_to_pdf",
+    "close_browser",
+    "close_sync_browser",
     "PDF_PRESETS",
     "generate_chart_svg",
 ]
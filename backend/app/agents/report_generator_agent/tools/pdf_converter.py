@@ -8,90 +8,509 @@ Install: pip install playwright && playwright install chromium
 """
 
 import asyncio
+import atexit
+import base64
 import tempfile
 import os
-from typing import Optional, Union, Dict, Any
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from types import MappingProxyType
+from typing import Optional, Union, Dict, Any, AsyncIterator, Awaitable, Callable, List, Mapping, Tuple
 from pathlib import Path
 
+# WeasyPrint has no page.pdf() options; mirror the Chromium A4 defaults in CSS
+_WEASY_PAGE_CSS = "@page { size: A4; margin: 15mm; }"
+
+
+# Page options as accepted by page.pdf(), or the name of a PDF_PRESETS entry
+PdfOptions = Union[str, Dict[str, Any]]
+
+
+# ============================================
+# WARM BROWSER
+# ============================================
+
+class _WarmBrowser:
+    """Playwright driver + Chromium process owned by one event loop, with its page pool."""
+
+    __slots__ = ("playwright", "browser", "lock", "pages", "pooled")
+
+    def __init__(self):
+        self.playwright = None
+        self.browser = None
+        self.lock = asyncio.Lock()
+        # Idle static-report pages; None entries wake a waiter after a discard
+        self.pages: "asyncio.Queue" = asyncio.Queue()
+        self.pooled = 0
+
+
+# Chromium services a static, server-rendered report never needs
+_CHROMIUM_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=Translate,BackForwardCache",
+    "--hide-scrollbars",
+    "--mute-audio",
+)
+
+
+# Playwright objects are bound to the loop that created them, so keep one
+# warm browser per live loop; entries vanish when their loop is collected.
+_BROWSERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _WarmBrowser]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _get_browser():
+    """
+    Return the warm Chromium browser for the running loop, launching it once.
+    
+    Each conversion opens its own BrowserContext on this browser, so requests
+    stay isolated without paying a process launch per report.
+    """
+    return (await _get_warm()).browser
+
+
+async def _get_warm() -> _WarmBrowser:
+    """Return the running loop's warm browser handle, (re)launching Chromium if needed."""
+    loop = asyncio.get_running_loop()
+    warm = _BROWSERS.get(loop)
+    if warm is None:
+        warm = _BROWSERS[loop] = _WarmBrowser()
+    
+    async with warm.lock:
+        if warm.browser is None or not warm.browser.is_connected():
+            if warm.playwright is None:
+                from playwright.async_api import async_playwright
+                warm.playwright = await async_playwright().start()
+            warm.browser = await warm.playwright.chromium.launch(headless=True, args=list(_CHROMIUM_ARGS))
+    return warm
+
+
+async def close_browser() -> None:
+    """Shut down the warm browser owned by the running loop, if any."""
+    warm = _BROWSERS.pop(asyncio.get_running_loop(), None)
+    if warm is None:
+        return
+    async with warm.lock:
+        if warm.browser is not None:
+            await warm.browser.close()
+        if warm.playwright is not None:
+            await warm.playwright.stop()
+
+
+def _shutdown_browsers() -> None:
+    for loop in list(_BROWSERS.keys()):
+        if loop.is_closed():
+            continue
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(close_browser(), loop).result(timeout=5)
+            else:
+                loop.run_until_complete(close_browser())
+        except Exception:
+            pass
+
+
+atexit.register(_shutdown_browsers)
+
+
+# ============================================
+# PAGE POOL
+# ============================================
+# Static reports (JavaScript off) render on recycled pages: a new context
+# and page cost a renderer IPC round trip per report, set_content on a warm
+# page does not. Pages are blanked between jobs and dropped on any error.
+
+_PAGE_POOL_SIZE = 4
+_BLANK_HTML = "<!DOCTYPE html><html></html>"
+
+
+async def _acquire_page(warm: _WarmBrowser):
+    """Take an idle pooled page, opening a new one while the pool is below size."""
+    while True:
+        if warm.pages.empty() and warm.pooled < _PAGE_POOL_SIZE:
+            warm.pooled += 1
+            try:
+                context = await warm.browser.new_context(java_script_enabled=False)
+                page = await context.new_page()
+                # Lay out once in print mode rather than screen then print
+                await page.emulate_media(media="print")
+            except BaseException:
+                # Free the slot and wake a waiter, as _release_page does
+                warm.pooled -= 1
+                warm.pages.put_nowait(None)
+                raise
+            return page
+        
+        page = await warm.pages.get()
+        if page is None:
+            continue
+        if page.is_closed() or page.context.browser is not warm.browser:
+            # Left over from a browser that has since been relaunched
+            warm.pooled -= 1
+            continue
+        return page
+
+
+async def _release_page(warm: _WarmBrowser, page, healthy: bool) -> None:
+    """Blank a page and return it to the pool, or discard it and free its slot."""
+    if healthy and not page.is_closed():
+        try:
+            await page.set_content(_BLANK_HTML)
+            warm.pages.put_nowait(page)
+            return
+        except Exception:
+            pass
+    warm.pooled -= 1
+    warm.pages.put_nowait(None)
+    try:
+        await page.context.close()
+    except Exception:
+        pass
+
+
+# ============================================
+# CDP PRINT PARAMETERS
+# ============================================
+# Pages are printed with a direct Page.printToPDF DevTools call. Options keep
+# Playwright's page.pdf() spelling and are translated here, with paper sizes
+# and margins resolved to the inch floats CDP expects.
+
+# Paper sizes in inches (width, height), as used by page.pdf(format=...)
+_PAPER_SIZES = {
+    "letter": (8.5, 11),
+    "legal": (8.5, 14),
+    "tabloid": (11, 17),
+    "ledger": (17, 11),
+    "a0": (33.1, 46.8),
+    "a1": (23.4, 33.1),
+    "a2": (16.54, 23.4),
+    "a3": (11.7, 16.54),
+    "a4": (8.27, 11.7),
+    "a5": (5.83, 8.27),
+    "a6": (4.13, 5.83),
+}
+
+_UNITS_PER_INCH = {"px": 96.0, "in": 1.0, "cm": 2.54, "mm": 25.4}
+
+# page.pdf() keyword -> Page.printToPDF parameter, for options passed through as-is
+_CDP_PASSTHROUGH = {
+    "landscape": "landscape",
+    "print_background": "printBackground",
+    "display_header_footer": "displayHeaderFooter",
+    "header_template": "headerTemplate",
+    "footer_template": "footerTemplate",
+    "prefer_css_page_size": "preferCSSPageSize",
+    "scale": "scale",
+    "page_ranges": "pageRanges",
+    "outline": "generateDocumentOutline",
+    "tagged": "generateTaggedPDF",
+}
+
+_MARGIN_PARAMS = (
+    ("top", "marginTop"),
+    ("right", "marginRight"),
+    ("bottom", "marginBottom"),
+    ("left", "marginLeft"),
+)
+
+
+def _to_inches(value: Union[str, int, float]) -> float:
+    """Convert a CSS length ("15mm", "0.5in", "1920px", bare numbers = px) to inches"""
+    if isinstance(value, (int, float)):
+        return value / _UNITS_PER_INCH["px"]
+    text = value.strip().lower()
+    unit = text[-2:]
+    if unit in _UNITS_PER_INCH:
+        return float(text[:-2]) / _UNITS_PER_INCH[unit]
+    return float(text) / _UNITS_PER_INCH["px"]
+
+
+def _to_cdp_params(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate page.pdf()-style options into Page.printToPDF parameters.
+    
+    Every page.pdf() keyword is accepted. omit_background is carried as
+    "omitBackground" and applied by _print_to_pdf before printing; path is
+    ignored, since the converters write files through output_path.
+    """
+    params: Dict[str, Any] = {}
+    for key, value in options.items():
+        if key == "path":
+            continue
+        if key == "omit_background":
+            params["omitBackground"] = value
+        elif key in _CDP_PASSTHROUGH:
+            params[_CDP_PASSTHROUGH[key]] = value
+        elif key == "format":
+            params["paperWidth"], params["paperHeight"] = _PAPER_SIZES[value.lower()]
+        elif key in ("width", "height"):
+            params["paper" + key.capitalize()] = _to_inches(value)
+        elif key == "margin":
+            for side, param in _MARGIN_PARAMS:
+                if side in value:
+                    params[param] = _to_inches(value[side])
+        else:
+            raise ValueError(f"Unsupported PDF option: {key}")
+    return params
+
+
+# Page furniture Chromium stamps into every page margin; no report DOM needed
+_PDF_HEADER_TEMPLATE = "<div></div>"
+_PDF_FOOTER_TEMPLATE = (
+    "<div style=\"font-size: 8pt; width: 100%; text-align: center; color: #9ca3af;\">"
+    "PharmAssist Intelligence — Confidential — "
+    "Page <span class=\"pageNumber\"></span> of <span class=\"totalPages\"></span>"
+    "</div>"
+)
+
+# Default PDF options for A4 professional report
+_DEFAULT_PDF_OPTIONS = {
+    "format": "A4",
+    "print_background": True,  # Include background colors/images
+    "margin": {
+        "top": "15mm",
+        "right": "15mm",
+        "bottom": "15mm",
+        "left": "15mm",
+    },
+    "display_header_footer": True,
+    "header_template": _PDF_HEADER_TEMPLATE,
+    "footer_template": _PDF_FOOTER_TEMPLATE,
+    "prefer_css_page_size": True,  # Respect @page CSS rules
+}
+
+_URL_PDF_OPTIONS = {
+    "format": "A4",
+    "print_background": True,
+    "margin": {"top": "15mm", "right": "15mm", "bottom": "15mm", "left": "15mm"},
+}
+
+_DEFAULT_CDP_PARAMS = _to_cdp_params(_DEFAULT_PDF_OPTIONS)
+_URL_CDP_PARAMS = _to_cdp_params(_URL_PDF_OPTIONS)
+
+
+# Emulation.setDefaultBackgroundColorOverride colour for omit_background
+_TRANSPARENT = {"r": 0, "g": 0, "b": 0, "a": 0}
+
+
+async def _open_print_session(page, cdp_params: Mapping[str, Any]):
+    """Attach a CDP session and apply omitBackground; return (session, printToPDF params)"""
+    params = dict(cdp_params)
+    omit_background = params.pop("omitBackground", False)
+    cdp = await page.context.new_cdp_session(page)
+    if omit_background:
+        await cdp.send("Emulation.setDefaultBackgroundColorOverride", {"color": _TRANSPARENT})
+    return cdp, params
+
+
+async def _print_to_pdf(page, cdp_params: Mapping[str, Any]) -> bytes:
+    """Print the page with one Page.printToPDF DevTools call"""
+    cdp, params = await _open_print_session(page, cdp_params)
+    try:
+        result = await cdp.send("Page.printToPDF", params)
+    finally:
+        await cdp.detach()
+    return base64.b64decode(result["data"])
+
+
+# Read size for streamed PDFs; one IO.read round trip per chunk
+_PDF_STREAM_CHUNK = 64 * 1024
+
+
+async def _print_to_pdf_stream(page, cdp_params: Mapping[str, Any]) -> AsyncIterator[bytes]:
+    """
+    Print the page with Page.printToPDF in stream mode, yielding the PDF in
+    chunks so it never has to be held in memory as a whole.
+    """
+    cdp, params = await _open_print_session(page, cdp_params)
+    try:
+        result = await cdp.send("Page.printToPDF", {**params, "transferMode": "ReturnAsStream"})
+        handle = result["stream"]
+        try:
+            while True:
+                chunk = await cdp.send("IO.read", {"handle": handle, "size": _PDF_STREAM_CHUNK})
+                data = chunk["data"]
+                if data:
+                    yield base64.b64decode(data) if chunk.get("base64Encoded") else data.encode("latin-1")
+                if chunk.get("eof"):
+                    break
+        finally:
+            await cdp.send("IO.close", {"handle": handle})
+    finally:
+        await cdp.detach()
+
+
+def _resolve_pdf_options(pdf_options: Optional[PdfOptions]) -> Mapping[str, Any]:
+    """Merge caller options over the report defaults; return the Page.printToPDF parameters"""
+    if isinstance(pdf_options, str):
+        if pdf_options not in _PRESETS_CDP:
+            raise ValueError(f"Unknown PDF preset: {pdf_options}")
+        return _PRESETS_CDP[pdf_options]
+    if pdf_options:
+        return _to_cdp_params({**_DEFAULT_PDF_OPTIONS, **pdf_options})
+    return _DEFAULT_CDP_PARAMS
+
+
+@asynccontextmanager
+async def _report_page(html_content: str, static_only: bool):
+    """Yield a print-ready page holding html_content (pooled when static_only)"""
+    if static_only:
+        warm = await _get_warm()
+        page = await _acquire_page(warm)
+        healthy = False
+        try:
+            # Set content and wait for stylesheets and web fonts
+            await page.set_content(html_content, wait_until="domcontentloaded")
+            await _wait_for_paint_ready(page)
+            yield page
+            healthy = True
+        finally:
+            await _release_page(warm, page, healthy)
+        return
+    
+    browser = await _get_browser()
+    context = await browser.new_context(java_script_enabled=True)
+    
+    try:
+        page = await context.new_page()
+        
+        # Lay out once in print mode rather than screen then print
+        await page.emulate_media(media="print")
+        
+        # Set content and wait for stylesheets and web fonts
+        await page.set_content(html_content, wait_until="domcontentloaded")
+        await _wait_for_paint_ready(page)
+        yield page
+    finally:
+        await context.close()
+
+
+async def _wait_for_paint_ready(page) -> None:
+    """
+    Wait until the page can be printed: subresources loaded and every
+    pending web font decoded. Fires as soon as that is true instead of
+    sitting out a fixed network-quiet window.
+    """
+    await page.wait_for_load_state("load")
+    await page.evaluate("document.fonts.ready.then(() => null)")
+
 
 async def convert_html_to_pdf_async(
     html_content: str,
     output_path: Optional[str] = None,
-    pdf_options: Optional[Dict[str, Any]] = None,
+    pdf_options: Optional[PdfOptions] = None,
+    static_only: bool = True,
 ) -> Union[bytes, str]:
     """
     Convert HTML content to PDF using Playwright (async).
     
     Uses Chromium browser for high-fidelity HTML/CSS rendering,
     including support for modern CSS features, gradients, flexbox, grid, etc.
+    With output_path the PDF is streamed to disk and never buffered in memory.
     
     Args:
         html_content: HTML string to convert
         output_path: Optional file path to save PDF. If None, returns bytes.
-        pdf_options: Optional Playwright PDF options
+        pdf_options: Optional Playwright PDF options, or the name of a PDF_PRESETS entry.
+            Any page.pdf() keyword except path, which output_path replaces.
+        static_only: Render with JavaScript disabled. The generated reports
+            are static HTML/CSS; pass False for documents that need scripts.
         
     Returns:
         PDF bytes if no output_path, otherwise the path to saved file
     """
-    from playwright.async_api import async_playwright
+    cdp_params = _resolve_pdf_options(pdf_options)
     
-    # Default PDF options for A4 professional report
-    default_options = {
-        "format": "A4",
-        "print_background": True,  # Include background colors/images
-        "margin": {
-            "top": "15mm",
-            "right": "15mm",
-            "bottom": "15mm",
-            "left": "15mm",
-        },
-        "display_header_footer": False,
-        "prefer_css_page_size": True,  # Respect @page CSS rules
-    }
+    if output_path:
+        # Stream straight to disk
+        with _atomic_output(output_path) as f:
+            async with _report_page(html_content, static_only) as page:
+                async for chunk in _print_to_pdf_stream(page, cdp_params):
+                    f.write(chunk)
+        return output_path
     
-    if pdf_options:
-        default_options.update(pdf_options)
+    async with _report_page(html_content, static_only) as page:
+        return await _print_to_pdf(page, cdp_params)
+
+
+# mkstemp creates files 0600; give the output the mode open() would have
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_OUTPUT_FILE_MODE = 0o666 & ~_UMASK
+
+
+@contextmanager
+def _atomic_output(output_path: str):
+    """
+    Yield a binary file that replaces output_path once the block completes.
+    
+    The temp file sits beside the target so os.replace is an atomic rename
+    and readers never see a partial PDF; it is removed if the block fails.
+    """
+    directory = os.path.dirname(os.path.abspath(output_path))
+    fd, tmp_path = tempfile.mkstemp(suffix=".pdf", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+        os.chmod(tmp_path, _OUTPUT_FILE_MODE)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+async def convert_html_to_pdf_stream(
+    html_content: str,
+    pdf_options: Optional[PdfOptions] = None,
+    static_only: bool = True,
+) -> AsyncIterator[bytes]:
+    """
+    Convert HTML content to PDF, yielding the document in 64 KB chunks.
+    
+    Suitable for FastAPI's StreamingResponse: large reports are forwarded
+    as Chromium produces them instead of being buffered in full.
     
-    async with async_playwright() as p:
-        # Launch headless Chromium
-        browser = await p.chromium.launch(headless=True)
+    Args:
+        html_content: HTML string to convert
+        pdf_options: Optional Playwright PDF options, or the name of a PDF_PRESETS entry
+        static_only: Render with JavaScript disabled (see convert_html_to_pdf_async)
         
-        try:
-            page = await browser.new_page()
-            
-            # Set content and wait for rendering
-            await page.set_content(html_content, wait_until="networkidle")
-            
-            # Wait for fonts to load (important for Inter font)
-            await page.wait_for_timeout(500)
-            
-            # Generate PDF
-            if output_path:
-                await page.pdf(path=output_path, **default_options)
-                return output_path
-            else:
-                pdf_bytes = await page.pdf(**default_options)
-                return pdf_bytes
-                
-        finally:
-            await browser.close()
+    Yields:
+        Consecutive chunks of the PDF file
+    """
+    cdp_params = _resolve_pdf_options(pdf_options)
+    async with _report_page(html_content, static_only) as page:
+        async for chunk in _print_to_pdf_stream(page, cdp_params):
+            yield chunk
 
 
 def convert_html_to_pdf(
     html_content: str,
     output_path: Optional[str] = None,
-    pdf_options: Optional[Dict[str, Any]] = None,
+    pdf_options: Optional[PdfOptions] = None,
+    static_only: bool = True,
+    engine: str = "chromium",
 ) -> Union[bytes, str]:
     """
     Convert HTML content to PDF using Playwright (sync wrapper).
     
     This is the main entry point for synchronous code.
-    Uses Chromium for pixel-perfect rendering.
+    Uses Chromium for pixel-perfect rendering, or WeasyPrint in-process
+    with engine="weasyprint".
     
     Args:
         html_content: HTML string to convert
         output_path: Optional file path to save PDF. If None, returns bytes.
-        pdf_options: Optional Playwright PDF options
+        pdf_options: Optional Playwright PDF options, or the name of a PDF_PRESETS entry
+        static_only: Render with JavaScript disabled (see convert_html_to_pdf_async)
+        engine: "chromium" (default) or "weasyprint"; the latter ignores
+            pdf_options and static_only and renders A4 pages
         
     Returns:
         PDF bytes if no output_path, otherwise the path to saved file
@@ -102,34 +521,141 @@ def convert_html_to_pdf(
         >>> # Or save to file
         >>> convert_html_to_pdf(html, "/path/to/report.pdf")
     """
+    if engine == "weasyprint":
+        return convert_html_to_pdf_weasy(html_content, output_path)
+    if engine != "chromium":
+        raise ValueError(f"Unknown PDF engine: {engine}")
+    return _run_sync(
+        lambda: convert_html_to_pdf_async(html_content, output_path, pdf_options, static_only)
+    )
+
+
+def convert_html_to_pdf_weasy(
+    html_content: str,
+    output_path: Optional[str] = None,
+) -> Union[bytes, str]:
+    """
+    Convert HTML content to PDF in-process with WeasyPrint.
+    
+    No browser, subprocess or DevTools round trips: the HTML and CSS are
+    laid out directly in Python. Suited to the static report template,
+    which uses no JavaScript. Pages are A4 with 15 mm margins, matching
+    the Chromium defaults, unless the document's own @page rules say
+    otherwise.
+    
+    Install: pip install weasyprint
+    
+    Args:
+        html_content: HTML string to convert
+        output_path: Optional file path to save PDF. If None, returns bytes.
+        
+    Returns:
+        PDF bytes if no output_path, otherwise the path to saved file
+    """
+    # Imported on first use: loading WeasyPrint costs far more than the
+    # Chromium path that most callers take
     try:
-        # Try to get existing event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is running (e.g., in Jupyter or async context),
-            # create a new thread to run the coroutine
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    convert_html_to_pdf_async(html_content, output_path, pdf_options)
-                )
-                return future.result()
-        else:
-            return loop.run_until_complete(
-                convert_html_to_pdf_async(html_content, output_path, pdf_options)
-            )
-    except RuntimeError:
-        # No event loop exists, create one
-        return asyncio.run(
-            convert_html_to_pdf_async(html_content, output_path, pdf_options)
-        )
+        import weasyprint
+    except ImportError:
+        raise ImportError("WeasyPrint is not installed. Install: pip install weasyprint")
+    
+    document = weasyprint.HTML(string=html_content)
+    stylesheets = [weasyprint.CSS(string=_WEASY_PAGE_CSS)]
+    if output_path:
+        document.write_pdf(target=output_path, stylesheets=stylesheets)
+        return output_path
+    return document.write_pdf(stylesheets=stylesheets)
+
+
+# Sync entry points submit to one long-lived loop on a daemon thread, so the
+# warm browser survives between calls and no per-call loop is built or torn down.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the converter's event loop thread, starting it on first use."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="pdf-converter-loop", daemon=True
+            ).start()
+            _LOOP = loop
+    return _LOOP
+
+
+def _run_sync(make_coro: Callable[[], Awaitable[Any]]) -> Any:
+    """Run a conversion coroutine on the background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(make_coro(), _background_loop()).result()
+
+
+def close_sync_browser() -> None:
+    """
+    Shut down the warm browser the sync converters started on their loop
+    thread, if any. close_browser() only reaches the caller's own loop.
+    """
+    loop = _LOOP
+    if loop is None or loop.is_closed() or loop not in _BROWSERS:
+        return
+    asyncio.run_coroutine_threadsafe(close_browser(), loop).result()
+
+
+async def convert_many_async(
+    items: List[Tuple[str, Optional[str]]],
+    concurrency: int = 4,
+    pdf_options: Optional[PdfOptions] = None,
+) -> List[Union[bytes, str]]:
+    """
+    Convert a batch of HTML documents to PDF concurrently (async).
+    
+    All documents render in their own BrowserContext on the shared warm
+    browser; the semaphore bounds how many pages Chromium holds at once.
+    
+    Args:
+        items: (html_content, output_path) pairs; output_path may be None
+        concurrency: Maximum number of pages rendering at the same time
+        pdf_options: Optional Playwright PDF options or PDF_PRESETS name, applied to every item
+        
+    Returns:
+        One result per item, in input order: PDF bytes, or the saved path
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    # Launch once up front rather than letting every worker queue on the lock
+    await _get_browser()
+    
+    async def _worker(html_content: str, output_path: Optional[str]) -> Union[bytes, str]:
+        async with semaphore:
+            return await convert_html_to_pdf_async(html_content, output_path, pdf_options)
+    
+    return await asyncio.gather(*[_worker(html, path) for html, path in items])
+
+
+def convert_many(
+    items: List[Tuple[str, Optional[str]]],
+    concurrency: int = 4,
+    pdf_options: Optional[PdfOptions] = None,
+) -> List[Union[bytes, str]]:
+    """
+    Convert a batch of HTML documents to PDF (sync wrapper).
+    
+    Args:
+        items: (html_content, output_path) pairs; output_path may be None
+        concurrency: Maximum number of pages rendering at the same time
+        pdf_options: Optional Playwright PDF options or PDF_PRESETS name, applied to every item
+        
+    Returns:
+        One result per item, in input order: PDF bytes, or the saved path
+    """
+    return _run_sync(lambda: convert_many_async(items, concurrency, pdf_options))
 
 
 def convert_html_file_to_pdf(
     html_file_path: str,
     output_path: Optional[str] = None,
-    pdf_options: Optional[Dict[str, Any]] = None,
+    pdf_options: Optional[PdfOptions] = None,
 ) -> Union[bytes, str]:
     """
     Convert an HTML file to PDF.
@@ -137,7 +663,7 @@ def convert_html_file_to_pdf(
     Args:
         html_file_path: Path to the HTML file
         output_path: Optional output path for PDF (defaults to same name with .pdf)
-        pdf_options: Optional Playwright PDF options
+        pdf_options: Optional Playwright PDF options, or the name of a PDF_PRESETS entry
         
     Returns:
         PDF bytes or path to saved file
@@ -155,6 +681,7 @@ def convert_url_to_pdf(
     url: str,
     output_path: Optional[str] = None,
     pdf_options: Optional[Dict[str, Any]] = None,
+    wait_strategy: str = "fast",
 ) -> Union[bytes, str]:
     """
     Convert a web page URL to PDF.
@@ -163,38 +690,41 @@ def convert_url_to_pdf(
         url: URL of the page to convert
         output_path: Optional output path for PDF
         pdf_options: Optional Playwright PDF options
+        wait_strategy: "fast" prints once the page and its fonts have loaded;
+            "networkidle" also waits for XHR traffic to settle, for pages
+            that render content client-side
         
     Returns:
         PDF bytes or path to saved file
     """
     async def _convert():
-        from playwright.async_api import async_playwright
-        
-        default_options = {
-            "format": "A4",
-            "print_background": True,
-            "margin": {"top": "15mm", "right": "15mm", "bottom": "15mm", "left": "15mm"},
-        }
-        
         if pdf_options:
-            default_options.update(pdf_options)
+            cdp_params = _to_cdp_params({**_URL_PDF_OPTIONS, **pdf_options})
+        else:
+            cdp_params = _URL_CDP_PARAMS
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page()
+        browser = await _get_browser()
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
+            await page.emulate_media(media="print")
+            if wait_strategy == "networkidle":
                 await page.goto(url, wait_until="networkidle")
-                await page.wait_for_timeout(1000)  # Wait for dynamic content
-                
-                if output_path:
-                    await page.pdf(path=output_path, **default_options)
-                    return output_path
-                else:
-                    return await page.pdf(**default_options)
-            finally:
-                await browser.close()
+            else:
+                await page.goto(url, wait_until="domcontentloaded")
+            await _wait_for_paint_ready(page)
+            
+            pdf_bytes = await _print_to_pdf(page, cdp_params)
+            if output_path:
+                with open(output_path, 'wb') as f:
+                    f.write(pdf_bytes)
+                return output_path
+            else:
+                return pdf_bytes
+        finally:
+            await context.close()
     
-    return asyncio.run(_convert())
+    return _run_sync(_convert)
 
 
 # PDF generation options presets
@@ -219,11 +749,25 @@ PDF_PRESETS = {
         "format": "A4",
         "print_background": True,
         "margin": {"top": "0", "right": "0", "bottom": "0", "left": "0"},
+        "display_header_footer": False,  # No margin to draw the footer in
     },
     "presentation": {
         "width": "1920px",
         "height": "1080px",
         "print_background": True,
         "margin": {"top": "0", "right": "0", "bottom": "0", "left": "0"},
+        "display_header_footer": False,
     },
 }
+
+# Presets merged over the report defaults and translated to Page.printToPDF
+# parameters once; read-only so a caller cannot corrupt the shared copies.
+_PRESET_OPTIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    name: MappingProxyType({**_DEFAULT_PDF_OPTIONS, **preset})
+    for name, preset in PDF_PRESETS.items()
+})
+
+_PRESETS_CDP: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    name: MappingProxyType(_to_cdp_params(options))
+    for name, options in _PRESET_OPTIONS.items()
+})
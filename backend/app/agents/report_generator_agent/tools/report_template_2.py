@@ -15,6 +15,7 @@ Features:
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
+import math
 
 
 class PharmReportTemplate:
@@ -2379,7 +2380,6 @@ class PharmReportTemplate:
             large_arc = 1 if angle > 180 else 0
             
             # Convert to radians
-            import math
             start_rad = math.radians(start_angle)
             end_rad = math.radians(end_angle)
             
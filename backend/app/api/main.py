@@ -14,11 +14,14 @@ if sys.platform == 'win32':
         if not hasattr(signal, sig_name):
             setattr(signal, sig_name, sig_val)
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from app.agents.report_generator_agent.tools import close_browser, close_sync_browser
 from app.api.routes import analysis, health, sessions, voice, report, news
 from app.core.config import API_METADATA, CORS_ORIGINS
 from app.core.db import init_db
@@ -29,6 +32,9 @@ async def lifespan(app: FastAPI):
     app.state.db = init_db()
     print("[API] Database initialized successfully")
     yield
+    await close_browser()
+    # The sync converters keep their own browser on a background loop
+    await asyncio.to_thread(close_sync_browser)
 
 
 app = FastAPI(**API_METADATA, lifespan=lifespan)
@@ -41,6 +47,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Routes that return PDFs, whose streams are already deflate-compressed
+_PDF_ROUTES = ("/report/generate/pdf", "/generate-report/", "/generate-comparison-report")
+
+
+class _TextGZipMiddleware:
+    """GZip responses except PDF downloads, where it only burns CPU."""
+
+    def __init__(self, app, minimum_size: int):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(_PDF_ROUTES):
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
+
+# HTML reports and JSON agent payloads compress ~5x; skip tiny responses
+app.add_middleware(_TextGZipMiddleware, minimum_size=1024)
+
 app.include_router(health.router)
 app.include_router(sessions.router)
 app.include_router(analysis.router)
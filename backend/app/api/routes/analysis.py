@@ -14,7 +14,7 @@ from app.services.llm_orchestrator import plan_and_run_session
 from app.services.generate_pdf_report import create_comparison_pdf_report
 from app.services.report_data_manager import report_data_manager
 from app.agents.report_generator_agent import run_report_generator_agent
-from app.agents.report_generator_agent.tools import convert_html_to_pdf_async
+from app.agents.report_generator_agent.tools import convert_html_to_pdf
 from app.services.query_classifier import classify_query
 
 
@@ -447,7 +447,7 @@ def generate_report(
                 indication=indication,
                 agents_data=agents_data,
                 use_crew=False,
-                output_format="html",
+                output_format="pdf",
             )
             
             if result["status"] != "success":
@@ -471,25 +471,8 @@ def generate_report(
             # Save to generated_reports folder
             permanent_path = reports_dir / f"{safe_drug}_{timestamp}.pdf"
             
-            # Convert to PDF
-            import asyncio
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            if loop.is_running():
-                # If event loop is running, use thread
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(
-                        asyncio.run,
-                        convert_html_to_pdf_async(html_content, str(permanent_path))
-                    )
-                    future.result()
-            else:
-                loop.run_until_complete(convert_html_to_pdf_async(html_content, str(permanent_path)))
+            # Convert to PDF on the converter's shared loop and warm browser
+            convert_html_to_pdf(html_content, str(permanent_path))
             
             # Create temporary copy for FileResponse (gets cleaned up)
             with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
@@ -635,7 +618,7 @@ def generate_report(
             indication=indication,
             agents_data=agents_data,
             use_crew=False,
-            output_format="html",
+            output_format="pdf",
         )
         
         if result["status"] != "success":
@@ -659,25 +642,8 @@ def generate_report(
         # Save to generated_reports folder
         permanent_path = reports_dir / f"{safe_drug}_{timestamp}.pdf"
         
-        # Convert to PDF
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        if loop.is_running():
-            # If event loop is running, use thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    asyncio.run,
-                    convert_html_to_pdf_async(html_content, str(permanent_path))
-                )
-                future.result()
-        else:
-            loop.run_until_complete(convert_html_to_pdf_async(html_content, str(permanent_path)))
+        # Convert to PDF on the converter's shared loop and warm browser
+        convert_html_to_pdf(html_content, str(permanent_path))
         
         # Create temporary copy for FileResponse (gets cleaned up)
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
@@ -5,9 +5,11 @@ Endpoints for generating pharmaceutical intelligence reports.
 """
 
 from fastapi import APIRouter, HTTPException, Response, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+import asyncio
 import json
 
 from app.core.auth import get_current_user
@@ -91,7 +93,8 @@ async def generate_report(
         Generated report with HTML content and analysis summary
     """
     try:
-        result = run_report_generator_agent(
+        result = await asyncio.to_thread(
+            run_report_generator_agent,
             drug_name=request.drug_name,
             indication=request.indication,
             agents_data=request.agents_data,
@@ -127,7 +130,8 @@ async def generate_html_report(
     suitable for direct browser rendering or downloading.
     """
     try:
-        result = run_report_generator_agent(
+        result = await asyncio.to_thread(
+            run_report_generator_agent,
             drug_name=request.drug_name,
             indication=request.indication,
             agents_data=request.agents_data,
@@ -171,12 +175,13 @@ async def generate_pdf_report(
         from app.agents.report_generator_agent.tools import convert_html_to_pdf_async
         
         # First generate HTML
-        result = run_report_generator_agent(
+        result = await asyncio.to_thread(
+            run_report_generator_agent,
             drug_name=request.drug_name,
             indication=request.indication,
             agents_data=request.agents_data,
             use_crew=False,
-            output_format="html",
+            output_format="pdf",
         )
         
         if result.get("status") == "error":
@@ -259,7 +264,7 @@ async def quick_analysis(
 
 
 @router.get("/template/preview")
-async def preview_template() -> Response:
+async def preview_template() -> StreamingResponse:
     """
     Preview the report template with sample data.
     
@@ -295,9 +300,28 @@ async def preview_template() -> Response:
         }
     }
     
-    html_content = template.generate(sample_data)
+    return StreamingResponse(
+        template.iter_bytes(
+            sample_data,
+            stylesheet_href=f"{router.prefix}/static/{template.stylesheet_filename}",
+        ),
+        media_type="text/html"
+    )
+
+
+@router.get("/static/{filename}")
+async def report_stylesheet(filename: str) -> Response:
+    """
+    Serve the non-critical report CSS as an external stylesheet.
+    
+    The file name embeds a hash of the CSS content, so the response can be
+    cached forever; a template change produces a new URL.
+    """
+    if filename != PharmReportTemplate.stylesheet_filename:
+        raise HTTPException(status_code=404, detail="Stylesheet not found")
     
     return Response(
-        content=html_content,
-        media_type="text/html"
+        content=PharmReportTemplate.deferred_css_bytes,
+        media_type="text/css",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"}
     )
@@ -0,0 +1,35 @@
+"""
+Shared pytest setup for the backend tests.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import app.agents
+
+_REPORT_PACKAGE = "app.agents.report_generator_agent"
+
+
+def _register_report_package() -> None:
+    """
+    Make the report generator's template, chart and PDF modules importable
+    without CrewAI.
+    
+    The package __init__ imports the CrewAI agent, which none of those
+    modules need. When crewai is not installed the package is registered
+    over its directory without running __init__, so submodule imports
+    resolve as usual. With crewai installed nothing changes.
+    """
+    if _REPORT_PACKAGE in sys.modules or importlib.util.find_spec("crewai") is not None:
+        return
+    path = Path(app.agents.__file__).parent / "report_generator_agent"
+    spec = importlib.util.spec_from_file_location(
+        _REPORT_PACKAGE, path / "__init__.py", submodule_search_locations=[str(path)]
+    )
+    sys.modules[_REPORT_PACKAGE] = importlib.util.module_from_spec(spec)
+
+
+_register_report_package()
@@ -0,0 +1,34 @@
+"""
+Unit tests for the report SVG chart renderers.
+
+Run:
+    pytest backend/tests/test_chart_render.py -v
+"""
+
+from __future__ import annotations
+
+from app.agents.report_generator_agent import chart_render
+
+
+MARKUP = "<script>alert(1)</script>"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Escaping agent text
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestEscaping:
+
+    def test_bar_chart_escapes_title_and_labels(self):
+        svg = chart_render.render_bar_chart(MARKUP, [{"year": MARKUP, "value": 3}], "year", "value")
+        assert MARKUP not in svg
+        assert svg.count("&lt;script&gt;alert(1)&lt;/script&gt;") == 2
+
+    def test_pie_chart_escapes_title_and_labels(self):
+        svg = chart_render.render_pie_chart(MARKUP, [{"company": MARKUP, "share": "40%"}], "company", "share", ("#000",))
+        assert MARKUP not in svg
+        assert svg.count("&lt;script&gt;alert(1)&lt;/script&gt;") == 2
+
+    def test_empty_data_renders_nothing(self):
+        assert chart_render.render_bar_chart(MARKUP, [], "year", "value") == ""
+        assert chart_render.render_pie_chart(MARKUP, [], "company", "share", ("#000",)) == ""
@@ -0,0 +1,253 @@
+"""
+Unit tests for the report PDF converter (no Chromium required).
+
+Run:
+    pytest backend/tests/test_pdf_converter.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import stat
+import sys
+
+import pytest
+
+from app.agents.report_generator_agent.tools import pdf_converter
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Fakes: just enough of Playwright's Browser / BrowserContext / Page
+# ═══════════════════════════════════════════════════════════════════════════
+
+class FakePage:
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+
+    async def emulate_media(self, media: str) -> None:
+        pass
+
+    def is_closed(self) -> bool:
+        return False
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser"):
+        self.browser = browser
+
+    async def new_page(self) -> FakePage:
+        return FakePage(self)
+
+
+class FakeBrowser:
+    """new_context() fails the first `failures` calls, after `gate` is set."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.gate = asyncio.Event()
+
+    async def new_context(self, **kwargs) -> FakeContext:
+        await self.gate.wait()
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("Target closed")
+        return FakeContext(self)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Page pool
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestPagePool:
+
+    def test_failed_page_creation_wakes_waiter(self):
+        """A waiter blocked on a full pool gets the slot a failed creation frees."""
+
+        async def scenario():
+            warm = pdf_converter._WarmBrowser()
+            warm.browser = FakeBrowser(failures=1)
+            # Every other slot is held by a page that is busy rendering
+            warm.pooled = pdf_converter._PAGE_POOL_SIZE - 1
+
+            first = asyncio.create_task(pdf_converter._acquire_page(warm))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(pdf_converter._acquire_page(warm))
+            await asyncio.sleep(0)
+            assert warm.pooled == pdf_converter._PAGE_POOL_SIZE
+
+            warm.browser.gate.set()
+            with pytest.raises(RuntimeError):
+                await first
+            page = await asyncio.wait_for(second, timeout=1)
+            return warm, page
+
+        warm, page = asyncio.run(scenario())
+        assert page.context.browser is warm.browser
+        assert warm.pooled == pdf_converter._PAGE_POOL_SIZE
+
+    def test_failed_page_creation_frees_slot(self):
+        async def scenario():
+            warm = pdf_converter._WarmBrowser()
+            warm.browser = FakeBrowser(failures=1)
+            warm.browser.gate.set()
+            with pytest.raises(RuntimeError):
+                await pdf_converter._acquire_page(warm)
+            return warm
+
+        warm = asyncio.run(scenario())
+        assert warm.pooled == 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Atomic output
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestAtomicOutput:
+
+    def test_replaces_target(self, tmp_path):
+        target = tmp_path / "report.pdf"
+        target.write_bytes(b"stale")
+        with pdf_converter._atomic_output(str(target)) as f:
+            f.write(b"%PDF-new")
+        assert target.read_bytes() == b"%PDF-new"
+        assert [p.name for p in tmp_path.iterdir()] == ["report.pdf"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_output_gets_umask_mode(self, tmp_path):
+        target = tmp_path / "report.pdf"
+        with pdf_converter._atomic_output(str(target)) as f:
+            f.write(b"%PDF-new")
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~umask
+
+    def test_failure_keeps_target_and_removes_temp_file(self, tmp_path):
+        target = tmp_path / "report.pdf"
+        target.write_bytes(b"previous")
+        with pytest.raises(RuntimeError):
+            with pdf_converter._atomic_output(str(target)) as f:
+                f.write(b"%PDF-partial")
+                raise RuntimeError("render failed")
+        assert target.read_bytes() == b"previous"
+        assert [p.name for p in tmp_path.iterdir()] == ["report.pdf"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  page.pdf() options -> Page.printToPDF parameters
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestCdpParams:
+
+    @pytest.mark.parametrize("value, inches", [
+        ("15mm", 15 / 25.4),
+        ("0.5in", 0.5),
+        ("1920px", 20.0),
+        ("2.54cm", 1.0),
+        (" 10MM ", 10 / 25.4),
+        ("96", 1.0),
+        (96, 1.0),
+        (48.0, 0.5),
+    ])
+    def test_to_inches(self, value, inches):
+        assert pdf_converter._to_inches(value) == pytest.approx(inches)
+
+    def test_format_and_margins(self):
+        params = pdf_converter._to_cdp_params({
+            "format": "Letter",
+            "print_background": True,
+            "margin": {"top": "1in", "left": "25.4mm"},
+        })
+        assert params == {
+            "paperWidth": 8.5,
+            "paperHeight": 11,
+            "printBackground": True,
+            "marginTop": 1.0,
+            "marginLeft": pytest.approx(1.0),
+        }
+
+    def test_width_and_height(self):
+        params = pdf_converter._to_cdp_params({"width": "1920px", "height": "1080px"})
+        assert params == {"paperWidth": 20.0, "paperHeight": 11.25}
+
+    def test_page_pdf_only_keywords(self):
+        params = pdf_converter._to_cdp_params({"path": "out.pdf", "omit_background": True})
+        assert params == {"omitBackground": True}
+
+    def test_unknown_option(self):
+        with pytest.raises(ValueError, match="Unsupported PDF option: colour"):
+            pdf_converter._to_cdp_params({"colour": "red"})
+
+    def test_presets(self):
+        presets = pdf_converter._PRESETS_CDP
+        assert set(presets) == set(pdf_converter.PDF_PRESETS)
+        assert presets["a4_landscape"]["landscape"] is True
+        assert presets["letter_portrait"]["paperWidth"] == 8.5
+        assert presets["presentation"]["paperWidth"] == 20.0
+
+    def test_omit_background_overrides_before_print(self):
+        sent = []
+
+        class FakeSession:
+            async def send(self, method, params):
+                sent.append((method, params))
+                return {"data": ""}
+
+            async def detach(self):
+                pass
+
+        class PrintContext:
+            async def new_cdp_session(self, page):
+                return FakeSession()
+
+        class PrintPage:
+            context = PrintContext()
+
+        params = pdf_converter._to_cdp_params({"format": "A4", "omit_background": True})
+        asyncio.run(pdf_converter._print_to_pdf(PrintPage(), params))
+        assert [method for method, _ in sent] == [
+            "Emulation.setDefaultBackgroundColorOverride", "Page.printToPDF",
+        ]
+        assert "omitBackground" not in sent[1][1]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Shutdown
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestShutdown:
+
+    def test_close_sync_browser_closes_background_loop_browser(self):
+        closed = []
+
+        class ClosingBrowser:
+            async def close(self):
+                closed.append(asyncio.get_running_loop())
+
+        loop = pdf_converter._background_loop()
+        warm = pdf_converter._WarmBrowser()
+        warm.browser = ClosingBrowser()
+        pdf_converter._BROWSERS[loop] = warm
+
+        pdf_converter.close_sync_browser()
+        assert closed == [loop]
+        assert loop not in pdf_converter._BROWSERS
+
+    def test_close_sync_browser_without_background_loop(self, monkeypatch):
+        monkeypatch.setattr(pdf_converter, "_LOOP", None)
+        pdf_converter.close_sync_browser()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  WeasyPrint engine
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestWeasyPrint:
+
+    def test_not_imported_with_the_module(self):
+        assert not hasattr(pdf_converter, "weasyprint")
+
+    def test_missing_weasyprint_raises_import_error(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "weasyprint", None)
+        with pytest.raises(ImportError, match="pip install weasyprint"):
+            pdf_converter.convert_html_to_pdf_weasy("<html></html>")
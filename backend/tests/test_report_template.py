@@ -0,0 +1,211 @@
+"""
+Unit tests for the PharmAssist HTML report template.
+
+Run:
+    pytest backend/tests/test_report_template.py -v
+"""
+
+from __future__ import annotations
+
+import io
+from datetime import datetime
+
+import pytest
+
+from app.agents.report_generator_agent import report_template
+from app.agents.report_generator_agent.report_template import PharmReportTemplate
+
+
+SAMPLE_DATA = {
+    "drug_name": "Metformin <X>",
+    "indication": "Pancreatic Cancer & Co",
+    "report_date": "January 01, 2026",
+    "opportunity_score": 62,
+    "key_takeaways": ["Growth <strong>", "Clear FTO"],
+    "recommendation": "PROCEED & monitor",
+    "iqvia": {"data": {
+        "summary": {"researcherQuestion": "Worth it?", "answer": "Yes - High growth", "explainers": ["a"]},
+        "marketSizeUSD": 12.5, "cagrPercent": 8.5,
+        "market_forecast": {"title": "Trajectory", "data": [{"year": 2024, "value": 8.2}, {"year": 2025, "value": 9.9}]},
+    }},
+    "clinical": {"data": {
+        "summary": {"researcherQuestion": "Evidence?", "answer": "Moderate", "explainers": []},
+        "analysis": {"phase_distribution": {"Phase 1": 3, "Phase 3": 5}, "total_trials": 8},
+    }},
+}
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def template(monkeypatch):
+    """Template with a frozen clock, so the footer timestamp is repeatable"""
+    monkeypatch.setattr(report_template, "datetime", _FixedDatetime)
+    report_template._SECTION_CACHE.clear()
+    return PharmReportTemplate()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Output paths
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestOutputPaths:
+
+    @pytest.mark.parametrize("for_pdf", [False, True])
+    def test_iter_html_matches_generate(self, template, for_pdf):
+        html = template.generate(SAMPLE_DATA, for_pdf=for_pdf)
+        assert "".join(template.iter_html(SAMPLE_DATA, for_pdf=for_pdf)) == html
+
+    @pytest.mark.parametrize("for_pdf", [False, True])
+    def test_iter_bytes_matches_generate(self, template, for_pdf):
+        html = template.generate(SAMPLE_DATA, for_pdf=for_pdf)
+        assert b"".join(template.iter_bytes(SAMPLE_DATA, for_pdf=for_pdf)) == html.encode("utf-8")
+
+    def test_iter_bytes_with_external_stylesheet(self, template):
+        href = "/static/" + PharmReportTemplate.stylesheet_filename
+        html = template.generate(SAMPLE_DATA, stylesheet_href=href)
+        assert b"".join(template.iter_bytes(SAMPLE_DATA, stylesheet_href=href)) == html.encode("utf-8")
+        assert PharmReportTemplate.critical_css in html
+        assert PharmReportTemplate.deferred_css not in html
+
+    @pytest.mark.parametrize("for_pdf", [False, True])
+    def test_generate_bytes_matches_generate(self, template, for_pdf):
+        html = template.generate(SAMPLE_DATA, for_pdf=for_pdf)
+        assert template.generate_bytes(SAMPLE_DATA, for_pdf=for_pdf) == html.encode("utf-8")
+
+    @pytest.mark.parametrize("for_pdf", [False, True])
+    def test_write_to_matches_generate(self, template, for_pdf):
+        stream = io.StringIO()
+        template.write_to(SAMPLE_DATA, stream, for_pdf=for_pdf)
+        assert stream.getvalue() == template.generate(SAMPLE_DATA, for_pdf=for_pdf)
+
+    def test_absent_sections_render_empty(self, template):
+        html = template.generate({"drug_name": "X", "report_date": "Today"})
+        assert "X" in html
+        assert "Trajectory" not in html
+
+    def test_section_cache_returns_same_markup(self, template):
+        first = template.generate(SAMPLE_DATA)
+        assert len(report_template._SECTION_CACHE._entries) > 0
+        assert template.generate(SAMPLE_DATA) == first
+        changed = {**SAMPLE_DATA, "recommendation": "HOLD"}
+        assert "HOLD" in template.generate(changed)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Stylesheets
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestStyles:
+
+    def test_external_stylesheet_has_noscript_fallback(self):
+        """Without JavaScript the preload's onload swap never runs; <noscript> must load it"""
+        html = PharmReportTemplate()._render_styles("/static/report.css?v=1&x=2")
+        assert '<link rel="preload" href="/static/report.css?v=1&amp;x=2" as="style"' in html
+        assert '<noscript><link rel="stylesheet" href="/static/report.css?v=1&amp;x=2"></noscript>' in html
+
+    def test_inline_styles_without_href(self):
+        html = PharmReportTemplate()._render_styles(None)
+        assert html == report_template._INLINE_STYLES_HTML
+        assert "<noscript>" not in html
+
+    def test_generate_css_default_is_full_stylesheet(self):
+        assert PharmReportTemplate.generate_css() == PharmReportTemplate.css
+
+    def test_generate_css_subset(self):
+        css = PharmReportTemplate.generate_css(["base"])
+        assert css
+        assert len(css) < len(PharmReportTemplate.css)
+
+    def test_generate_css_rejects_unknown_blocks(self):
+        with pytest.raises(ValueError, match="Unknown CSS blocks: nope, zzz"):
+            PharmReportTemplate.generate_css(["base", "zzz", "nope"])
+
+    def test_split_critical_css_partitions_rules(self):
+        css = "body{margin:0}.chart{color:red}/* cover */.cover-title{font:1em 'a;b'}"
+        critical, deferred = report_template._split_critical_css(css)
+        assert "body{margin:0}" in critical
+        assert "/* cover */.cover-title{font:1em 'a;b'}" in critical
+        assert ".chart{color:red}" in deferred
+        assert sorted(critical + deferred) == sorted(css)
+
+    def test_minify_css_keeps_strings_and_descendant_spaces(self):
+        css = """
+            /* note */
+            .a  .b > .c { content: "x  ;  y" ; color : red; }
+        """
+        minified = report_template._minify_css(css)
+        assert "note" not in minified
+        assert '"x  ;  y"' in minified
+        assert ".a .b" in minified
+
+    def test_apply_media_type(self):
+        css = ".a{x:1}@media print{.p{x:2}}@media screen{.s{x:3}}"
+        assert report_template._apply_media_type(css, "print") == ".a{x:1}.p{x:2}"
+        assert report_template._apply_media_type(css, "screen") == ".a{x:1}.s{x:3}"
+
+    def test_print_stylesheet_has_no_media_type_blocks(self):
+        assert "@media print" not in report_template._CSS_PRINT
+        assert "@media screen" not in report_template._CSS_PRINT
+
+    def test_strip_interactive_rules(self):
+        css = ".a:hover{color:red}.b{color:blue;transition:all 1s}.c,.c:focus{x:1}.d{transition:none}"
+        assert report_template._strip_interactive_rules(css) == ".b{color:blue;}.c,.c:focus{x:1}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Render cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestRenderCache:
+
+    def test_evicts_least_recently_used(self):
+        cache = report_template._RenderCache(maxsize=2)
+        cache.put(("a",), "A")
+        cache.put(("b",), "B")
+        assert cache.get(("a",)) == "A"
+        cache.put(("c",), "C")
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == "A"
+        assert cache.get(("c",)) == "C"
+
+    def test_data_digest_ignores_key_order(self):
+        digest = report_template._data_digest
+        assert digest({"a": 1, "b": [1, {"x": 2, "y": 3}]}) == digest({"b": [1, {"y": 3, "x": 2}], "a": 1})
+        assert digest({"a": 1}) != digest({"a": 2})
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  Escaping agent values
+# ═══════════════════════════════════════════════════════════════════════════
+
+MARKUP = "<script>alert(1)</script>"
+
+MARKUP_DATA = {
+    "drug_name": "X",
+    "report_date": "Today",
+    "iqvia": {"data": {
+        "market_forecast": {"title": MARKUP, "data": [{"year": 2024, "value": 1.0}]},
+        "topTherapies": [{"therapy": "A", "share": "40%"}],
+        "competitive_share": {"title": MARKUP},
+    }},
+    "clinical": {"data": {"analysis": {"phase_distribution": {"Phase 1": MARKUP}, "total_trials": MARKUP}}},
+    "patent": {"data": {"patentsFound": MARKUP, "normalizedRiskInternal": MARKUP}},
+    "web_intelligence": {"data": {
+        "top_signal": {"score": MARKUP, "label": "HIGH", "text": "t"},
+        "sentiment_summary": {"positive": MARKUP, "neutral": MARKUP, "negative": MARKUP},
+    }},
+}
+
+
+class TestEscaping:
+
+    @pytest.mark.parametrize("for_pdf", [False, True])
+    def test_agent_values_are_escaped(self, template, for_pdf):
+        html = template.generate(MARKUP_DATA, for_pdf=for_pdf)
+        assert MARKUP not in html
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html